@@ -1,9 +1,38 @@
-from .grpc_client import GrpcClient
-from .http_client import HttpClient
+from typing import TYPE_CHECKING
 
 try:
     from ._version import __version__
 except ImportError:  # pragma: no cover
     __version__ = "unknown"
 
-__all__ = ["GrpcClient", "HttpClient"]
+if TYPE_CHECKING:
+    from .async_grpc_client import AsyncGrpcClient
+    from .async_http_client import AsyncHttpClient
+    from .grpc_client import GrpcClient
+    from .http_client import HttpClient
+
+__all__ = ["AsyncGrpcClient", "AsyncHttpClient", "GrpcClient", "HttpClient"]
+
+# clients are imported on first access (PEP 562), so that importing the package
+# doesn't pull in grpc and protobuf when only the http client is used
+_lazy_imports = {
+    "AsyncGrpcClient": ".async_grpc_client",
+    "AsyncHttpClient": ".async_http_client",
+    "GrpcClient": ".grpc_client",
+    "HttpClient": ".http_client",
+}
+
+
+def __getattr__(name: str):
+    if name not in _lazy_imports:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    value = getattr(importlib.import_module(_lazy_imports[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted([*globals(), *_lazy_imports])
@@ -0,0 +1,223 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Sequence
+from functools import cached_property
+from typing import Any, Optional, Union
+
+import grpc
+
+from .grpc_client import _GrpcClientBase, _message_classes_cache, _model_metadata
+
+log = logging.getLogger(__name__)
+
+_end_of_stream = object()
+
+
+async def _coalesce(call) -> AsyncIterator[str]:
+    """yields the generated text of the messages of `call`, joining the chunks
+    received while the consumer was busy processing the previous ones"""
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def read():
+        try:
+            async for message in call:
+                queue.put_nowait(message.generated_text)
+        except Exception as exc:
+            queue.put_nowait(exc)
+        else:
+            queue.put_nowait(_end_of_stream)
+
+    reader = asyncio.ensure_future(read())
+    try:
+        while True:
+            items = [await queue.get()]
+            while not queue.empty():
+                items.append(queue.get_nowait())
+
+            chunks = [item for item in items if isinstance(item, str)]
+            if chunks:
+                yield "".join(chunks)
+
+            last = items[-1]
+            if last is _end_of_stream:
+                return
+            if isinstance(last, Exception):
+                raise last
+    finally:
+        reader.cancel()
+
+
+class AsyncGrpcClient(_GrpcClientBase):
+    """asyncio GRPC client for a caikit nlp runtime server"""
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        *,
+        insecure: bool = False,
+        verify: Optional[bool] = None,
+        ca_cert: Union[None, bytes, str] = None,
+        client_cert: Union[None, bytes, str] = None,
+        client_key: Union[None, bytes, str] = None,
+        pool_size: int = 4,
+        compression: Optional[grpc.Compression] = None,
+        channel_options: Optional[Sequence[tuple[str, Any]]] = None,
+    ) -> None:
+        """Client class for a Caikit NLP grpc server, using `grpc.aio`
+
+        Takes the same arguments as `GrpcClient`. Channels are bound to an event
+        loop: they are created on the first request, within the running loop.
+        Unless already resolved by another client for the same server, message
+        types are queried from the server reflection service by the first
+        request, in a thread, rather than by the constructor.
+
+        >>> async with AsyncGrpcClient("localhost", port=8085, insecure=True) as client:
+        >>>     generated_text = await client.generate_text(
+        >>>         "flan-t5-small-caikit",
+        >>>         "What is the boiling point of Nitrogen?",
+        >>>     )
+        """
+        super().__init__(
+            host,
+            port,
+            insecure=insecure,
+            verify=verify,
+            ca_cert=ca_cert,
+            client_cert=client_cert,
+            client_key=client_key,
+            pool_size=pool_size,
+            compression=compression,
+            channel_options=channel_options,
+        )
+
+    def _new_channel(self, options: list[tuple[str, Any]]) -> grpc.aio.Channel:
+        if self._credentials is None:
+            return grpc.aio.insecure_channel(
+                self._target, options=options, compression=self._compression
+            )
+        return grpc.aio.secure_channel(
+            self._target,
+            self._credentials,
+            options=options,
+            compression=self._compression,
+        )
+
+    @cached_property
+    def _reflection_channel(self) -> grpc.Channel:  # type: ignore[override]
+        # the reflection descriptor database only works with synchronous channels
+        return super()._new_channel(options=list(self._channel_options.items()))
+
+    def _load_message_classes(self) -> None:
+        # reflection queries block, they are left to `_ensure_message_classes`
+        # unless the message classes are already cached
+        if self._server in _message_classes_cache:
+            super()._load_message_classes()
+
+    async def _ensure_message_classes(self) -> None:
+        if "_generated_text_result" not in self.__dict__:
+            await asyncio.to_thread(super()._load_message_classes)
+
+    def get_text_generation_parameters(self) -> dict[str, Any]:
+        """returns a dict with available fields and their type
+
+        Queries the server reflection service (blocking) if no request was made
+        yet."""
+        if "_generated_text_result" not in self.__dict__:
+            super()._load_message_classes()
+        return super().get_text_generation_parameters()
+
+    async def generate_text(self, model_id: str, text: str, **kwargs) -> str:
+        """Queries the `generate_text` endpoint for the given model_id
+
+        Args:
+            model_id: the model identifier
+            text: the text to embed
+            kwargs: Any additional argument to be passed to text generation
+        Returns:
+            the generated text
+        """
+        if not model_id:
+            raise ValueError("request must have a model id")
+
+        log.info("Calling generate_text for '%s'", model_id)
+        await self._ensure_message_classes()
+        request = self._build_request(
+            self._text_generation_task_request, text, **kwargs
+        )
+        task_predict = self._task_predict[self._next_index()]
+        try:
+            response = await task_predict(
+                metadata=_model_metadata(model_id), request=request
+            )
+        except grpc.aio.AioRpcError as exc:
+            raise RuntimeError(exc.details()) from None
+
+        log.info("Calling generate_text was successful")
+
+        return response.generated_text
+
+    async def generate_text_stream(
+        self, model_id: str, text: str, *, coalesce: bool = False, **kwargs
+    ) -> AsyncIterator[str]:
+        """Queries the `generate_text_stream` endpoint for the given model_id
+
+        Args:
+            model_id: the model identifier
+            text: the text to embed
+            coalesce: join the chunks received while the consumer was busy, so
+                that slow consumers wake up once per batch of tokens rather than
+                once per token. Doesn't delay chunks when the consumer keeps up
+            kwargs: Any additional argument to be passed to text generation
+        Returns:
+            an async iterator over the generated text (tokens), as they are received
+        """
+        if not model_id:
+            raise ValueError("request must have a model id")
+
+        log.info("Calling generate_text_stream for '%s'", model_id)
+        await self._ensure_message_classes()
+        request = self._build_request(
+            self._task_text_generation_request, text, **kwargs
+        )
+        streaming_task_predict = self._streaming_task_predict[self._next_index()]
+        try:
+            call = streaming_task_predict(
+                metadata=_model_metadata(model_id), request=request
+            )
+            if coalesce:
+                async for chunk in _coalesce(call):
+                    yield chunk
+            else:
+                async for message in call:
+                    yield message.generated_text
+        except grpc.aio.AioRpcError as exc:
+            raise RuntimeError(exc.details()) from None
+
+    async def models_info(self) -> list[dict[str, Any]]:
+        if "_models_info_method" not in self.__dict__:
+            # reflection queries block, keep them out of the event loop
+            await asyncio.to_thread(getattr, self, "_models_info_method")
+
+        _, ModelInfoRequest, _ = self._models_info_method
+        models = await self._get_models_info(ModelInfoRequest())
+
+        return self._models_info_to_list(models)
+
+    async def close(self) -> None:
+        """closes the channels of the client"""
+        for channel in self.__dict__.pop("_channels", ()):
+            await channel.close()
+        for cached in ("_task_predict", "_streaming_task_predict", "_get_models_info"):
+            self.__dict__.pop(cached, None)
+
+        self.__dict__.pop("_desc_pool", None)
+        reflection_channel = self.__dict__.pop("_reflection_channel", None)
+        if reflection_channel is not None:
+            reflection_channel.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
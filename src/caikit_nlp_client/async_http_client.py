@@ -0,0 +1,341 @@
+import asyncio
+import json
+import logging
+import ssl
+from collections.abc import AsyncIterator
+from typing import Any, Optional, Union
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    # the client is still importable, e.g. by `from caikit_nlp_client import *`,
+    # creating one raises an ImportError
+    httpx = None  # type: ignore[assignment]
+
+from .http_client import (
+    _JSON_HEADERS,
+    _HttpClientBase,
+    _simplify_parameter_schema,
+    _SSEDecoder,
+    _stream_event_text,
+)
+from .utils import json_dumps, json_loads
+
+log = logging.getLogger(__name__)
+
+_end_of_stream = object()
+
+
+class AsyncHttpClient(_HttpClientBase):
+    """asyncio HTTP client for a caikit nlp runtime server"""
+
+    __slots__ = ("_client",)
+
+    def __init__(
+        self,
+        base_url: str,
+        verify: Optional[bool] = None,
+        ca_cert_path: Optional[str] = None,
+        client_cert_path: Optional[str] = None,
+        client_key_path: Optional[str] = None,
+        *,
+        http2: bool = False,
+    ):
+        """Client class for a Caikit NLP HTTP server, using `httpx`
+
+        Takes the same arguments as `HttpClient`, requires the `httpx` extra.
+
+        >>> async with AsyncHttpClient("http://localhost:8080") as client:
+        >>>     generated_text = await client.generate_text(
+        >>>         "flan-t5-small-caikit",
+        >>>         "What is the boiling point of Nitrogen?",
+        >>>     )
+
+        With `http2=True`, concurrent requests are multiplexed over a single
+        connection when the server negotiates HTTP/2 (ALPN `h2`, so only over
+        https). Other servers are reached over HTTP/1.1:
+
+        >>> client = AsyncHttpClient("https://localhost:8080", http2=True)
+        """
+        if httpx is None:
+            raise ImportError(
+                "AsyncHttpClient requires httpx, "
+                "install it with `pip install caikit-nlp-client[httpx]`"
+            )
+
+        super().__init__(
+            base_url,
+            verify=verify,
+            ca_cert_path=ca_cert_path,
+            client_cert_path=client_cert_path,
+            client_key_path=client_key_path,
+        )
+
+        # connections are kept alive and reused across requests
+        self._client = httpx.AsyncClient(verify=self._ssl_verify(), http2=http2)
+
+    def _ssl_verify(self) -> Union[bool, ssl.SSLContext]:
+        """TLS verification settings in the form expected by httpx"""
+        if not self._ca_cert_path:
+            return self._verify is not False
+
+        context = ssl.create_default_context(cafile=self._ca_cert_path)
+        if self._mtls_configured:
+            assert self._client_cert_path
+            context.load_cert_chain(self._client_cert_path, self._client_key_path)
+        return context
+
+    @staticmethod
+    def _response_reason(response: "httpx.Response") -> str:  # type: ignore[override]
+        return response.reason_phrase
+
+    async def close(self) -> None:
+        """closes the connections of the client"""
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def get_text_generation_parameters(self, timeout: float = 60.0) -> dict:
+        """returns a dict with available fields and their type
+
+        The openapi spec of the server is only fetched by the first call."""
+        if self._text_generation_schema is None:
+            response = await self._client.get(self._openapi_url, timeout=timeout)
+            self._text_generation_schema = self._parse_text_generation_schema(
+                response.content
+            )
+
+        return _simplify_parameter_schema(*self._text_generation_schema)
+
+    async def generate_text(
+        self,
+        model_id: str,
+        text: str,
+        timeout: float = 60.0,
+        **kwargs,
+    ) -> str:
+        """Queries the `text-generation` endpoint for the given model_id
+
+        Args:
+            model_id: the model identifier
+            text: the text to generate
+            timeout: HTTP request timeout value in seconds
+            kwargs: Any additional argument to be passed to text generation
+        Returns:
+            the generated text
+        """
+        if not model_id:
+            raise ValueError("request must have a model id")
+
+        log.info("Calling generate_text for '%s'", model_id)
+        response = await self._client.post(
+            self._api_url,
+            content=json_dumps(self._create_json_request(model_id, text, **kwargs)),
+            headers=_JSON_HEADERS,
+            timeout=timeout,
+        )
+        log.debug("Response: %s", response)
+        if response.status_code == 200:
+            return json_loads(response.content)["generated_text"]
+
+        try:
+            details = json_loads(response.content)["details"]
+        except json.JSONDecodeError:
+            details = f"{self._response_reason(response)} {response.text=}"
+
+        raise RuntimeError(f"{response.status_code=} {details}")
+
+    async def generate_text_stream(
+        self,
+        model_id: str,
+        text: str,
+        timeout: float = 60.0,
+        **kwargs,
+    ) -> AsyncIterator[str]:
+        """Queries the `text-generation` stream endpoint for the given model_id
+
+        Args:
+            model_id: the model identifier
+            text: the text to generate
+            timeout: HTTP request timeout value in seconds
+            kwargs: Any additional argument to be passed to text generation
+        Returns:
+            an async iterator over the generated text (tokens), as they are received
+        """
+        if not model_id:
+            raise ValueError("request must have a model id")
+
+        log.info("Calling generate_text_stream for '%s'", model_id)
+        async with self._client.stream(
+            "POST",
+            self._stream_api_url,
+            content=json_dumps(self._create_json_request(model_id, text, **kwargs)),
+            headers=_JSON_HEADERS,
+            timeout=timeout,
+        ) as response:
+            log.debug("Response: %s", response)
+            decoder = _SSEDecoder()
+            async for chunk in response.aiter_bytes():
+                for data in decoder.feed(chunk):
+                    yield _stream_event_text(data)
+            for data in decoder.close():
+                yield _stream_event_text(data)
+
+    async def generate_text_stream_batch(
+        self,
+        model_id: str,
+        texts: list[str],
+        timeout: float = 60.0,
+        *,
+        max_in_flight: int = 16,
+        **kwargs,
+    ) -> AsyncIterator[tuple[int, str]]:
+        """Streams the text generated for each of `texts` concurrently
+
+        Args:
+            model_id: the model identifier
+            texts: the texts to generate from
+            timeout: HTTP request timeout value in seconds
+            max_in_flight: maximum number of concurrent streams
+            kwargs: Any additional argument to be passed to text generation
+        Returns:
+            an async iterator over (index of the text, generated text) tuples, in
+            the order they are received. Other streams are cancelled when one
+            fails
+        """
+        if not model_id:
+            raise ValueError("request must have a model id")
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be a positive integer")
+
+        queue: asyncio.Queue = asyncio.Queue()
+        semaphore = asyncio.Semaphore(max_in_flight)
+
+        async def stream(index: int, text: str) -> None:
+            try:
+                async with semaphore:
+                    async for chunk in self.generate_text_stream(
+                        model_id, text, timeout, **kwargs
+                    ):
+                        queue.put_nowait((index, chunk))
+            except Exception as exc:
+                queue.put_nowait(exc)
+            else:
+                queue.put_nowait(_end_of_stream)
+
+        tasks = [asyncio.ensure_future(stream(i, text)) for i, text in enumerate(texts)]
+        try:
+            remaining = len(tasks)
+            while remaining:
+                item = await queue.get()
+                if item is _end_of_stream:
+                    remaining -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def models_info(self, timeout: float = 60.0) -> list[dict[str, Any]]:
+        response = await self._client.get(self._models_info_url, timeout=timeout)
+        response.raise_for_status()
+
+        return json_loads(response.content)["models"]
+
+    async def _task_post(
+        self,
+        task: str,
+        model_id: str,
+        inputs: Any,
+        timeout: float,
+        parameters: Optional[dict[str, Any]],
+    ) -> dict[str, Any]:
+        """posts a request to the endpoint of `task`, returns the response"""
+        if not model_id:
+            raise ValueError("request must have a model id")
+
+        log.info("Calling %s for '%s'", task, model_id)
+        response = await self._client.post(
+            self._task_urls[task],
+            content=json_dumps(self._create_task_request(model_id, inputs, parameters)),
+            headers=_JSON_HEADERS,
+            timeout=timeout,
+        )
+        log.debug("Response: %s", response)
+        return self._unpack_or_raise_details(response)
+
+    async def embedding(
+        self,
+        model_id: str,
+        text: str,
+        timeout: float = 60.0,
+        parameters: Optional[dict[str, Any]] = None,
+    ) -> dict[str, Any]:
+        return await self._task_post("embedding", model_id, text, timeout, parameters)
+
+    async def embedding_tasks(
+        self,
+        model_id: str,
+        texts: list[str],
+        timeout: float = 60.0,
+        parameters: Optional[dict[str, Any]] = None,
+    ) -> dict[str, Any]:
+        return await self._task_post(
+            "embedding-tasks", model_id, texts, timeout, parameters
+        )
+
+    async def sentence_similarity(
+        self,
+        model_id: str,
+        source_sentence: str,
+        sentences: list[str],
+        timeout: float = 60.0,
+        parameters: Optional[dict[str, Any]] = None,
+    ) -> dict[str, Any]:
+        inputs = {"source_sentence": source_sentence, "sentences": sentences}
+        return await self._task_post(
+            "sentence-similarity", model_id, inputs, timeout, parameters
+        )
+
+    async def sentence_similarity_tasks(
+        self,
+        model_id: str,
+        source_sentences: list[str],
+        sentences: list[str],
+        timeout: float = 60.0,
+        parameters: Optional[dict[str, Any]] = None,
+    ) -> dict[str, Any]:
+        inputs = {"source_sentences": source_sentences, "sentences": sentences}
+        return await self._task_post(
+            "sentence-similarity-tasks", model_id, inputs, timeout, parameters
+        )
+
+    async def rerank(
+        self,
+        model_id: str,
+        documents: list[dict[str, Any]],
+        query: str,
+        timeout: float = 60.0,
+        parameters: Optional[dict[str, Any]] = None,
+    ) -> dict[str, Any]:
+        inputs = {"documents": documents, "query": query}
+        return await self._task_post("rerank", model_id, inputs, timeout, parameters)
+
+    async def rerank_tasks(
+        self,
+        model_id: str,
+        documents: list[dict[str, Any]],
+        queries: list[str],
+        timeout: float = 60.0,
+        parameters: Optional[dict[str, Any]] = None,
+    ) -> dict[str, Any]:
+        inputs = {"documents": documents, "queries": queries}
+        return await self._task_post(
+            "rerank-tasks", model_id, inputs, timeout, parameters
+        )
@@ -1,57 +1,42 @@
-from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Optional
+from collections.abc import Iterator
+from typing import Any, Optional, Protocol
 
-if TYPE_CHECKING:
-    from collections.abc import Iterable
 
+class ClientBase(Protocol):
+    """interface implemented by the caikit nlp clients"""
 
-class ClientBase(ABC):
-    @abstractmethod
-    def get_text_generation_parameters(
-        self,
-        **kwargs,
-    ) -> dict[str, str]:
-        raise NotImplementedError
+    def get_text_generation_parameters(self) -> dict[str, Any]: ...
 
-    @abstractmethod
     def generate_text(
         self,
         model_id: str,
         text: str,
         **kwargs,
-    ) -> str:
-        raise NotImplementedError
+    ) -> str: ...
 
-    @abstractmethod
     def generate_text_stream(
         self,
         model_id: str,
         text: str,
         **kwargs,
-    ) -> Iterable[str]:
-        raise NotImplementedError
+    ) -> Iterator[str]: ...
 
-    @abstractmethod
     def embedding(
         self,
         model_id: str,
         text: str,
         timeout: float = 60.0,
         parameters: Optional[dict[str, Any]] = None,
-    ) -> dict[str, Any]:
-        raise NotImplementedError
+    ) -> dict[str, Any]: ...
 
-    @abstractmethod
     def embedding_tasks(
         self,
         model_id: str,
         texts: list[str],
         timeout: float = 60.0,
         parameters: Optional[dict[str, Any]] = None,
-    ) -> dict[str, Any]:
-        raise NotImplementedError
+    ) -> dict[str, Any]: ...
 
-    @abstractmethod
     def sentence_similarity(
         self,
         model_id: str,
@@ -59,10 +44,8 @@ class ClientBase(ABC):
         sentences: list[str],
         timeout: float = 60.0,
         parameters: Optional[dict[str, Any]] = None,
-    ) -> dict[str, Any]:
-        raise NotImplementedError
+    ) -> dict[str, Any]: ...
 
-    @abstractmethod
     def sentence_similarity_tasks(
         self,
         model_id: str,
@@ -70,10 +53,8 @@ class ClientBase(ABC):
         sentences: list[str],
         timeout: float = 60.0,
         parameters: Optional[dict[str, Any]] = None,
-    ) -> dict[str, Any]:
-        raise NotImplementedError
+    ) -> dict[str, Any]: ...
 
-    @abstractmethod
     def rerank(
         self,
         model_id: str,
@@ -81,10 +62,8 @@ class ClientBase(ABC):
         query: str,
         timeout: float = 60.0,
         parameters: Optional[dict[str, Any]] = None,
-    ) -> dict[str, Any]:
-        raise NotImplementedError
+    ) -> dict[str, Any]: ...
 
-    @abstractmethod
     def rerank_tasks(
         self,
         model_id: str,
@@ -92,9 +71,6 @@ class ClientBase(ABC):
         queries: list[str],
         timeout: float = 60.0,
         parameters: Optional[dict[str, Any]] = None,
-    ) -> dict[str, Any]:
-        raise NotImplementedError
+    ) -> dict[str, Any]: ...
 
-    @abstractmethod
-    def models_info(self) -> list[dict[str, Any]]:
-        raise NotImplementedError
+    def models_info(self) -> list[dict[str, Any]]: ...
@@ -1,30 +1,473 @@
+import itertools
 import logging
-from collections.abc import Iterable
-from typing import TYPE_CHECKING, Any, Optional, Union
+import os
+import time
+import weakref
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Optional, Union, cast
 
 import grpc
-from grpc_reflection.v1alpha.proto_reflection_descriptor_database import (
-    ProtoReflectionDescriptorDatabase,
-)
-
-from google.protobuf.descriptor_pool import DescriptorPool
-from google.protobuf.json_format import MessageToDict
-from google.protobuf.message_factory import GetMessageClass
+from google.protobuf.descriptor import FieldDescriptor
+from google.protobuf.internal import api_implementation
 
 from .utils import get_server_certificate
 
 if TYPE_CHECKING:
-    from google._upb._message import (
+    from google.protobuf.descriptor import (
         Descriptor,
-        Message,
         MethodDescriptor,
         ServiceDescriptor,
     )
+    from google.protobuf.descriptor_pool import DescriptorPool
+    from google.protobuf.message import Message
 
 log = logging.getLogger(__name__)
 
+if api_implementation.Type() == "python":
+    log.warning(
+        "protobuf is using its pure python implementation, requests and responses "
+        "(de)serialization will be slow. Make sure that "
+        "PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION is not set to 'python'"
+    )
+
+# message classes resolved through reflection, keyed by the (host, port) of the
+# server: clients of the same server skip the reflection round-trips. Oldest
+# entries are evicted first
+_message_classes_cache: dict[tuple[str, int], tuple[type["Message"], ...]] = {}
+_MESSAGE_CLASSES_CACHE_SIZE = 32
+
+
+# keepalive pings detect dead connections during long streams. The interval
+# matches the servers' default minimum ping interval (5 minutes) and pings are
+# only sent while calls are active, so that servers don't reject them with
+# "too many pings". Generated results can exceed the default 4MB message limit.
+_CHANNEL_OPTIONS: tuple[tuple[str, Any], ...] = (
+    ("grpc.keepalive_time_ms", 5 * 60 * 1000),
+    ("grpc.keepalive_timeout_ms", 20 * 1000),
+    ("grpc.max_receive_message_length", 64 * 1024 * 1024),
+)
+
+
+# grpcio>=1.62 registers the method path with the channel once, rather than
+# handling the method string on every call
+_REGISTERED_METHOD: dict[str, bool] = (
+    {"_registered_method": True}
+    if tuple(int(part) for part in grpc.__version__.split(".")[:2]) >= (1, 62)
+    else {}
+)
+
+_generated_text = attrgetter("generated_text")
+
+# maps protobuf field types (int) to human-readable strings, e.g. "int64"
+_GRPC_TYPE_TO_STR = {
+    getattr(FieldDescriptor, name): name.split("_")[1].lower()
+    for name in vars(FieldDescriptor)
+    if name.startswith("TYPE_")
+}
+
+
+@lru_cache(maxsize=128)
+def _model_metadata(model_id: str) -> tuple[tuple[str, str], ...]:
+    """grpc metadata routing a request to `model_id`"""
+    return (("mm-model-id", model_id),)
+
+
+@lru_cache(maxsize=16)
+def _ssl_channel_credentials(
+    root_certificates: Optional[bytes],
+    private_key: Optional[bytes],
+    certificate_chain: Optional[bytes],
+) -> grpc.ChannelCredentials:
+    """channel credentials are immutable, clients with the same certificates
+    share them"""
+    return grpc.ssl_channel_credentials(
+        root_certificates=root_certificates,
+        private_key=private_key,
+        certificate_chain=certificate_chain,
+    )
+
+
+# server certificates trusted with verify=False take an extra TLS handshake to
+# fetch, they are reused for up to _SERVER_CERTIFICATE_TTL seconds
+_SERVER_CERTIFICATE_TTL = 300
+
+
+@lru_cache(maxsize=128)
+def _cached_server_certificate(host: str, port: int, ttl_bucket: int) -> str:
+    """`get_server_certificate`, cached per `ttl_bucket`"""
+    return get_server_certificate(host, port)
+
+
+# contents of the certificate files, by (path, mtime_ns), so that a modified file
+# is read again. Oldest entries are evicted first
+_certificates: dict[tuple[str, int], bytes] = {}
+_CERTIFICATES_CACHE_SIZE = 32
+
+
+def _read_certificate(path: str, mtime_ns: int) -> bytes:
+    """reads a certificate file, or returns its cached contents"""
+    key = (path, mtime_ns)
+    if (certificate := _certificates.get(key)) is None:
+        with open(path, "rb") as secret_file:
+            certificate = secret_file.read()
+        if len(_certificates) >= _CERTIFICATES_CACHE_SIZE:
+            _certificates.pop(next(iter(_certificates)), None)
+        _certificates[key] = certificate
+    return certificate
+
+
+@lru_cache(maxsize=32)
+def _field_names(descriptor: "Descriptor") -> frozenset[str]:
+    """names of the fields of a message, to validate kwargs before building it"""
+    return frozenset(descriptor.fields_by_name)
+
+
+def _simplify_descriptor(descriptor: "Descriptor") -> dict:
+    """recursively flattens grpc descriptor into a human-friendly dict"""
+    flattened: dict = {}
+    for field in descriptor.fields:
+        if field.message_type:
+            flattened[field.name] = _simplify_descriptor(field.message_type)
+        else:
+            flattened[field.name] = _GRPC_TYPE_TO_STR[field.type]
+
+    return flattened
+
+
+def _close_channels(channels: list[grpc.Channel]) -> None:
+    for channel in channels:
+        try:
+            channel.close()
+        except Exception:
+            log.exception("Unexpected exception while closing client")
+
+
+class _GrpcClientBase:
+    """connection handling and message resolution shared by the grpc clients"""
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        *,
+        insecure: bool = False,
+        verify: Optional[bool] = None,
+        ca_cert: Union[None, bytes, str] = None,
+        client_cert: Union[None, bytes, str] = None,
+        client_key: Union[None, bytes, str] = None,
+        pool_size: int = 4,
+        compression: Optional[grpc.Compression] = None,
+        channel_options: Optional[Sequence[tuple[str, Any]]] = None,
+    ) -> None:
+        if pool_size < 1:
+            raise ValueError("pool_size must be a positive integer")
+
+        self._target = f"{host}:{port}"
+        self._pool_size = pool_size
+        self._compression = compression
+        # user options override the defaults with the same key
+        self._channel_options = dict(_CHANNEL_OPTIONS)
+        self._channel_options.update(channel_options or ())
+        self._credentials = self._make_credentials(
+            host,
+            port,
+            insecure=insecure,
+            verify=verify,
+            client_key=client_key,
+            client_cert=client_cert,
+            ca_cert=ca_cert,
+        )
+        self._round_robin = itertools.count()
+
+        self._server = (host, port)
+        self._load_message_classes()
+
+    def _load_message_classes(self) -> None:
+        """sets the text generation message classes, see `_resolve_message_classes`"""
+        try:
+            (
+                self._text_generation_task_request,
+                self._task_text_generation_request,
+                self._generated_text_result,
+            ) = self._resolve_message_classes(self._server)
+        except grpc._channel._MultiThreadedRendezvous as exc:
+            log.error("Could not connect to the server: %s", exc.details())
+            # the server certificate may have changed, fetch it again next time
+            _cached_server_certificate.cache_clear()
+            raise RuntimeError(
+                f"Could not connect to {self._target}:" f"{exc.details()}"
+            ) from None
+        except KeyError as exc:
+            log.error("The grpc server does not have the type: %s", exc)
+            raise ValueError(str(exc)) from exc
+
+    def _new_channel(self, options: list[tuple[str, Any]]) -> grpc.Channel:
+        """creates a channel to the server using the client credentials"""
+        if self._credentials is None:
+            return grpc.insecure_channel(
+                self._target, options=options, compression=self._compression
+            )
+        return grpc.secure_channel(
+            self._target,
+            self._credentials,
+            options=options,
+            compression=self._compression,
+        )
+
+    def _new_channels(self) -> list[Any]:
+        """creates the channels of the pool"""
+        # channels to the same target share their connections by default, a
+        # local subchannel pool gives each channel of the pool its own connection
+        options = list(self._channel_options.items())
+        if self._pool_size > 1:
+            options.append(("grpc.use_local_subchannel_pool", 1))
+        return [self._new_channel(options) for _ in range(self._pool_size)]
+
+    @cached_property
+    def _channels(self) -> list[Any]:
+        return self._new_channels()
+
+    @property
+    def _reflection_channel(self) -> grpc.Channel:
+        """channel used to query the server reflection service"""
+        return self._channels[0]
+
+    @cached_property
+    def _task_predict(self) -> list[Any]:
+        return [
+            channel.unary_unary(
+                "/caikit.runtime.Nlp.NlpService/TextGenerationTaskPredict",
+                request_serializer=self._text_generation_task_request.SerializeToString,
+                response_deserializer=self._generated_text_result.FromString,
+                **_REGISTERED_METHOD,
+            )
+            for channel in self._channels
+        ]
+
+    @cached_property
+    def _streaming_task_predict(self) -> list[Any]:
+        return [
+            channel.unary_stream(
+                "/caikit.runtime.Nlp.NlpService/ServerStreamingTextGenerationTaskPredict",
+                request_serializer=self._task_text_generation_request.SerializeToString,
+                response_deserializer=self._generated_text_result.FromString,
+                **_REGISTERED_METHOD,
+            )
+            for channel in self._channels
+        ]
+
+    @cached_property
+    def _desc_pool(self) -> "DescriptorPool":
+        """descriptor pool backed by the server reflection service"""
+        # reflection is only needed until message classes are cached, its modules
+        # are imported on first use to keep the import of the client fast
+        from google.protobuf.descriptor_pool import DescriptorPool
+        from grpc_reflection.v1alpha.proto_reflection_descriptor_database import (
+            ProtoReflectionDescriptorDatabase,
+        )
+
+        return DescriptorPool(
+            ProtoReflectionDescriptorDatabase(self._reflection_channel)
+        )
+
+    def _resolve_message_classes(
+        self, server: tuple[str, int]
+    ) -> tuple[type["Message"], ...]:
+        """returns the text generation message classes, querying the server
+        reflection service only if not already resolved for `server`"""
+        message_classes = _message_classes_cache.get(server)
+        if message_classes is None:
+            from google.protobuf.message_factory import GetMessageClass
+
+            # the reflection service returns the file defining a symbol along with
+            # its dependencies: resolving the service first fetches all the
+            # message types below in a single request
+            self._desc_pool.FindServiceByName("caikit.runtime.Nlp.NlpService")
+            message_classes = tuple(
+                GetMessageClass(self._desc_pool.FindMessageTypeByName(name))
+                for name in (
+                    "caikit.runtime.Nlp.TextGenerationTaskRequest",
+                    "caikit.runtime.Nlp.ServerStreamingTextGenerationTaskRequest",
+                    "caikit_data_model.nlp.GeneratedTextResult",
+                )
+            )
+            if len(_message_classes_cache) >= _MESSAGE_CLASSES_CACHE_SIZE:
+                _message_classes_cache.pop(next(iter(_message_classes_cache)), None)
+            _message_classes_cache[server] = message_classes
+        return message_classes
+
+    @cached_property
+    def _models_info_method(
+        self,
+    ) -> tuple[str, type["Message"], type["Message"]]:
+        """the method path, request and response classes of GetModelsInfo"""
+        from google.protobuf.message_factory import GetMessageClass
+
+        info_service: ServiceDescriptor = self._desc_pool.FindServiceByName(
+            "caikit.runtime.info.InfoService"
+        )
+
+        models_info: MethodDescriptor = info_service.methods_by_name["GetModelsInfo"]
+        ModelInfoRequest = GetMessageClass(
+            self._desc_pool.FindMessageTypeByName(models_info.input_type.full_name)
+        )
+        ModelInfoResponse = GetMessageClass(
+            self._desc_pool.FindMessageTypeByName(models_info.output_type.full_name)
+        )
+        return (
+            f"/{info_service.full_name}/{models_info.name}",
+            ModelInfoRequest,
+            ModelInfoResponse,
+        )
+
+    @cached_property
+    def _get_models_info(self) -> Any:
+        """GetModelsInfo stub, on the first channel of the pool"""
+        method, ModelInfoRequest, ModelInfoResponse = self._models_info_method
+        return self._channels[0].unary_unary(
+            method,
+            request_serializer=ModelInfoRequest.SerializeToString,
+            response_deserializer=ModelInfoResponse.FromString,
+            **_REGISTERED_METHOD,
+        )
+
+    @staticmethod
+    def _models_info_to_list(models: "Message") -> list[dict[str, Any]]:
+        from google.protobuf.json_format import MessageToDict
+
+        # proto field names match the output format of the http client's
+        return MessageToDict(models, preserving_proto_field_name=True)["models"]
+
+    def get_text_generation_parameters(self) -> dict[str, Any]:
+        """returns a dict with available fields and their type"""
+        descriptor = cast("Descriptor", self._task_text_generation_request.DESCRIPTOR)
+        return _simplify_descriptor(descriptor)
+
+    def _next_index(self) -> int:
+        """returns the index of the next channel of the pool to use"""
+        return next(self._round_robin) % self._pool_size
+
+    @staticmethod
+    def _build_request(
+        message_class: type["Message"], text: str, **kwargs
+    ) -> "Message":
+        """builds a request, converting kwargs to request fields.
+
+        Fields are set by the message constructor in a single call, which also
+        accepts dicts and lists for message and repeated fields."""
+        unsupported = kwargs.keys() - _field_names(message_class.DESCRIPTOR)
+        if unsupported:
+            key = min(unsupported)
+            raise ValueError(f"Unsupported kwarg {key=}")
+        return message_class(text=text, **kwargs)
+
+    def _make_credentials(
+        self,
+        host: str,
+        port: int,
+        *,
+        insecure: bool = False,
+        verify: Optional[bool] = None,
+        ca_cert: Union[None, bytes, str] = None,
+        client_key: Union[None, bytes, str] = None,
+        client_cert: Union[None, bytes, str] = None,
+    ) -> Optional[grpc.ChannelCredentials]:
+        """Creates the credentials of the grpc channels, None for plaintext
+
+        Args:
+        - host: str
+        - port: str
+        - (optional) insecure: use a plaintext connection (default=False)
+        - (optional) verify: set to False to disable remote host certificate(s)
+                     verification. Cannot be used with `plaintext` or with MTLS
+        - (optional) ca_cert: certificate authority to use
+        - (optional) client_key: client key for mTLS mode
+        - (optional) client_cert: client cert for mTLS mode
+
+        """
+        if not host.strip():
+            raise ValueError("A non empty host name is required")
+        if int(port) <= 0:
+            raise ValueError("A non zero port number is required")
+        if insecure and any(
+            (val is not None) for val in (ca_cert, client_key, client_cert)
+        ):
+            raise ValueError("cannot use insecure with TLS/mTLS certificates")
+        if insecure and verify:
+            raise ValueError("insecure cannot be used with verify")
+
+        client_key_bytes, client_cert_bytes, ca_cert_bytes = self._load_certificates(
+            client_key, client_cert, ca_cert
+        )
+
+        if insecure:
+            log.warning("Connecting over an insecure plaintext grpc channel")
+            return None
+
+        if bool(client_key_bytes) != bool(client_cert_bytes):
+            raise ValueError("client_key and client_cert must be provided together")
+
+        root_certificates = ca_cert_bytes
+        if not root_certificates and verify is False:
+            log.warning(
+                "insecure mode: trusting remote certificate from %s:%d",
+                host,
+                port,
+            )
+            root_certificates = _cached_server_certificate(
+                host, port, int(time.monotonic() // _SERVER_CERTIFICATE_TTL)
+            ).encode()
+
+        if client_key_bytes:
+            log.info("Connecting using mTLS for secure channel")
+        elif ca_cert_bytes:
+            log.info("Connecting using provided CA certificate for secure channel")
+
+        return _ssl_channel_credentials(
+            root_certificates, client_key_bytes, client_cert_bytes
+        )
+
+    @classmethod
+    def _load_certificates(
+        cls, *certificates: Union[None, bytes, str]
+    ) -> list[Optional[bytes]]:
+        """loads `certificates` with `_try_load_certificate`. Files that are not
+        cached yet are read in parallel when there are several of them, so that
+        slow (e.g. network mounted) storage latencies overlap"""
+        missing = []
+        for certificate in certificates:
+            if isinstance(certificate, str) and certificate:
+                key = (certificate, os.stat(certificate).st_mtime_ns)
+                if key not in _certificates:
+                    missing.append(key)
+
+        if len(missing) > 1:
+            with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+                list(executor.map(lambda key: _read_certificate(*key), missing))
+
+        return [cls._try_load_certificate(cert) for cert in certificates]
+
+    @staticmethod
+    def _try_load_certificate(certificate: Union[None, bytes, str]) -> Optional[bytes]:
+        """If the certificate points to a file, return the contents (plaintext reads).
+        Else return the bytes"""
+        if not certificate:
+            return None
+
+        if isinstance(certificate, bytes):
+            return certificate
+
+        if isinstance(certificate, str):
+            return _read_certificate(certificate, os.stat(certificate).st_mtime_ns)
+        raise ValueError(
+            f"{certificate=} should be a path to a certificate files or bytes"
+        )
+
 
-class GrpcClient:
+class GrpcClient(_GrpcClientBase):
     """GRPC client for a caikit nlp runtime server
 
     Args:
@@ -41,6 +484,9 @@ class GrpcClient:
         ca_cert: Union[None, bytes, str] = None,
         client_cert: Union[None, bytes, str] = None,
         client_key: Union[None, bytes, str] = None,
+        pool_size: int = 4,
+        compression: Optional[grpc.Compression] = None,
+        channel_options: Optional[Sequence[tuple[str, Any]]] = None,
     ) -> None:
         """Client class for a Caikit NLP grpc server
 
@@ -69,53 +515,56 @@ class GrpcClient:
         To skip certificate(s) verification:
 
         >>> client = GrpcClient(remote_host, port=443, verify=False)
+
+        Requests are dispatched round-robin over a pool of `pool_size` channels,
+        each one using its own connection. To use a single channel:
+
+        >>> client = GrpcClient(remote_host, port=443, pool_size=1)
+
+        To compress requests, e.g. for long prompts over slow links:
+
+        >>> client = GrpcClient(
+        >>>     remote_host, port=443, compression=grpc.Compression.Gzip
+        >>> )
+
+        Channels send keepalive pings every 5 minutes during calls and accept
+        messages up to 64MB. `channel_options` overrides these or sets other
+        grpc channel arguments:
+
+        >>> client = GrpcClient(
+        >>>     remote_host,
+        >>>     port=443,
+        >>>     channel_options=[("grpc.keepalive_time_ms", 60 * 1000)],
+        >>> )
+
+        Messages are (de)serialized by protobuf's native (upb) implementation, a
+        warning is logged if the pure python one is in use.
         """
-        self._channel = self._make_channel(
+        super().__init__(
             host,
             port,
             insecure=insecure,
             verify=verify,
-            client_key=client_key,
-            client_cert=client_cert,
             ca_cert=ca_cert,
+            client_cert=client_cert,
+            client_key=client_key,
+            pool_size=pool_size,
+            compression=compression,
+            channel_options=channel_options,
         )
 
-        self._reflection_db = ProtoReflectionDescriptorDatabase(self._channel)
-        self._desc_pool = DescriptorPool(self._reflection_db)
-        try:
-            self._text_generation_task_request = GetMessageClass(
-                self._desc_pool.FindMessageTypeByName(
-                    "caikit.runtime.Nlp.TextGenerationTaskRequest"
-                )
-            )
-            self._task_text_generation_request = GetMessageClass(
-                self._desc_pool.FindMessageTypeByName(
-                    "caikit.runtime.Nlp.ServerStreamingTextGenerationTaskRequest"
-                )
-            )
-            self._generated_text_result = GetMessageClass(
-                self._desc_pool.FindMessageTypeByName(
-                    "caikit_data_model.nlp.GeneratedTextResult"
-                )
-            )
-            self._task_predict = self._channel.unary_unary(
-                "/caikit.runtime.Nlp.NlpService/TextGenerationTaskPredict",
-                request_serializer=self._text_generation_task_request.SerializeToString,
-                response_deserializer=self._generated_text_result.FromString,
-            )
-            self._streaming_task_predict = self._channel.unary_stream(
-                "/caikit.runtime.Nlp.NlpService/ServerStreamingTextGenerationTaskPredict",
-                request_serializer=self._task_text_generation_request.SerializeToString,
-                response_deserializer=self._generated_text_result.FromString,
-            )
-        except grpc._channel._MultiThreadedRendezvous as exc:
-            log.error("Could not connect to the server: %s", exc.details())
-            raise RuntimeError(
-                f"Could not connect to {host}:{port}:" f"{exc.details()}"
-            ) from None
-        except KeyError as exc:
-            log.error("The grpc server does not have the type: %s", exc)
-            raise ValueError(str(exc)) from exc
+    @cached_property
+    def _channels(self) -> list[grpc.Channel]:
+        channels = self._new_channels()
+        # closes the channels once, whether the client is closed explicitly,
+        # garbage collected or still alive at interpreter exit
+        self._finalizer = weakref.finalize(self, _close_channels, channels)
+        return channels
+
+    @property
+    def _channel(self) -> grpc.Channel:
+        """the first channel of the pool, also used for non-generation calls"""
+        return self._channels[0]
 
     def generate_text(
         self,
@@ -145,50 +594,73 @@ class GrpcClient:
         if model_id == "":
             raise ValueError("request must have a model id")
 
-        log.info(f"Calling generate_text for '{model_id}'")
-        metadata = [("mm-model-id", model_id)]
-
-        request = self._text_generation_task_request()
+        log.info("Calling generate_text for '%s'", model_id)
+        metadata = _model_metadata(model_id)
 
-        self._populate_request(request, text, **kwargs)
+        request = self._build_request(
+            self._text_generation_task_request, text, **kwargs
+        )
+        task_predict = self._task_predict[self._next_index()]
         try:
-            response = self._task_predict(request=request, metadata=metadata)
+            response = task_predict(request=request, metadata=metadata)
         except grpc._channel._InactiveRpcError as exc:
             raise RuntimeError(exc.details()) from None
 
-        log.debug(f"Response: {response}")
+        log.debug("Response: %s", response)
         result = response.generated_text
         log.info("Calling generate_text was successful")
         return result
 
-    def get_text_generation_parameters(self) -> dict[str, Any]:
-        """returns a dict with available fields and their type"""
-        descriptor: Descriptor = self._task_text_generation_request.DESCRIPTOR
+    def generate_text_batch(
+        self,
+        model_id: str,
+        texts: list[str],
+        **kwargs,
+    ) -> list[str]:
+        """Sends a generate text request for each of the given texts, concurrently
 
-        # hack: used map the grpc type (int) to a human-readable string
-        grpc_type_to_str = {
-            getattr(descriptor.fields[0], t): t.split("_")[1].lower()
-            for t in dir(descriptor.fields[0])
-            if t.startswith("TYPE_")
-        }
+        Requests are sent without waiting for the previous responses, spread over
+        the channel pool, so that the total latency is close to that of the
+        slowest request rather than the sum of all of them.
 
-        def simplify_descriptor(
-            descriptor: "Descriptor",
-        ) -> dict:
-            """recursively flattens grpc descriptor into a human-friendly dict"""
+        Args:
+            model_id: the model identifier
+            texts: the texts to generate from
 
-            flattened: dict = {}
-            for field in descriptor.fields:
-                string_type = grpc_type_to_str[field.type]
+        Keyword Args:
+            same as `generate_text`, applied to every request
 
-                if field.message_type:
-                    flattened[field.name] = simplify_descriptor(field.message_type)
-                else:
-                    flattened[field.name] = string_type
+        Raises:
+            ValueError: thrown if an empty model id is passed
+            RuntimeError: thrown if any of the requests fails
+
+        Returns:
+            the generated texts, in the same order as `texts`
+        """
+        if model_id == "":
+            raise ValueError("request must have a model id")
 
-            return flattened
+        log.info("Calling generate_text_batch for '%s'", model_id)
+        metadata = _model_metadata(model_id)
 
-        return simplify_descriptor(descriptor)
+        # requests are all built before the first one is sent, so that an invalid
+        # text doesn't leave the previous requests running on the server
+        task_requests = [
+            self._build_request(self._text_generation_task_request, text, **kwargs)
+            for text in texts
+        ]
+        futures = []
+        try:
+            for request in task_requests:
+                task_predict = self._task_predict[self._next_index()]
+                futures.append(task_predict.future(request=request, metadata=metadata))
+            return [future.result().generated_text for future in futures]
+        except BaseException as exc:
+            for future in futures:
+                future.cancel()
+            if isinstance(exc, grpc.RpcError):
+                raise RuntimeError(exc.details()) from None
+            raise
 
     def __enter__(self):
         return self
@@ -202,7 +674,7 @@ class GrpcClient:
         model_id: str,
         text: str,
         **kwargs,
-    ) -> Iterable[str]:
+    ) -> Iterator[str]:
         """Sends a generate text stream request to the server for the given model id
 
         Args:
@@ -218,7 +690,7 @@ class GrpcClient:
             ValueError: thrown if an empty model id is passed
 
         Returns:
-            a list of generated text (tokens)
+            an iterator over the generated text (tokens), as they are received
 
         Example:
 
@@ -236,155 +708,31 @@ class GrpcClient:
         if not model_id:
             raise ValueError("request must have a model id")
 
-        log.info(f"Calling generate_text_stream for '{model_id}'")
+        log.info("Calling generate_text_stream for '%s'", model_id)
 
-        metadata = [("mm-model-id", model_id)]
+        metadata = _model_metadata(model_id)
 
-        request = self._task_text_generation_request()
-        self._populate_request(request, text, **kwargs)
+        request = self._build_request(
+            self._task_text_generation_request, text, **kwargs
+        )
+        streaming_task_predict = self._streaming_task_predict[self._next_index()]
 
         try:
-            yield from (
-                message.generated_text
-                for message in self._streaming_task_predict(
-                    metadata=metadata, request=request
-                )
+            # attrgetter runs in C, skipping a python frame per streamed chunk
+            yield from map(
+                _generated_text,
+                streaming_task_predict(metadata=metadata, request=request),
             )
         except grpc._channel._MultiThreadedRendezvous as exc:
             raise RuntimeError(exc.details()) from None
 
-    def _populate_request(self, request: "Message", text: str, **kwargs):
-        """dynamically converts kwargs to request attributes."""
-        request.text = text
-        for key, value in kwargs.items():
-            try:
-                setattr(request, key, value)
-            except AttributeError as exc:
-                raise ValueError(f"Unsupported kwarg {key=}") from exc
-
     def _close(self):
-        try:
-            if hasattr(self, "_channel") and self._channel:
-                self._channel.close()
-        except Exception:
-            log.exception("Unexpected exception while closing client")
-
-    def __del__(self):
-        self._close()
-
-    def _make_channel(
-        self,
-        host: str,
-        port: int,
-        *,
-        insecure: bool = False,
-        verify: Optional[bool] = None,
-        ca_cert: Union[None, bytes, str] = None,
-        client_key: Union[None, bytes, str] = None,
-        client_cert: Union[None, bytes, str] = None,
-    ) -> grpc.Channel:
-        """Creates a grpc channel
-
-        Args:
-        - host: str
-        - port: str
-        - (optional) insecure: use a plaintext connection (default=False)
-        - (optional) verify: set to False to disable remote host certificate(s)
-                     verification. Cannot be used with `plaintext` or with MTLS
-        - (optional) ca_cert: certificate authority to use
-        - (optional) client_key: client key for mTLS mode
-        - (optional) client_cert: client cert for mTLS mode
-
-        """
-        if not host.strip():
-            raise ValueError("A non empty host name is required")
-        if int(port) <= 0:
-            raise ValueError("A non zero port number is required")
-        if insecure and any(
-            (val is not None) for val in (ca_cert, client_key, client_cert)
-        ):
-            raise ValueError("cannot use insecure with TLS/mTLS certificates")
-        if insecure and verify:
-            raise ValueError("insecure cannot be used with verify")
-
-        client_key_bytes = self._try_load_certificate(client_key)
-        client_cert_bytes = self._try_load_certificate(client_cert)
-        ca_cert_bytes = self._try_load_certificate(ca_cert)
-
-        connection = f"{host}:{port}"
-        if insecure:
-            log.warning("Connecting over an insecure plaintext grpc channel")
-            return grpc.insecure_channel(connection)
-
-        credentials_kwargs: dict[str, bytes] = {}
-        if ca_cert_bytes and not (any((client_cert_bytes, client_key_bytes))):
-            log.info("Connecting using provided CA certificate for secure channel")
-            credentials_kwargs.update(root_certificates=ca_cert_bytes)
-        elif client_cert_bytes and client_key_bytes and ca_cert_bytes:
-            log.info("Connecting using mTLS for secure channel")
-            credentials_kwargs.update(
-                root_certificates=ca_cert_bytes,
-                private_key=client_key_bytes,
-                certificate_chain=client_cert_bytes,
-            )
-        elif verify is False:
-            log.warning(
-                "insecure mode: trusting remote certificate from %s:%d",
-                host,
-                port,
-            )
-
-            cert = get_server_certificate(host, port).encode()
-            credentials_kwargs.update(root_certificates=cert)
-
-        return grpc.secure_channel(
-            connection, grpc.ssl_channel_credentials(**credentials_kwargs)
-        )
-
-    @staticmethod
-    def _try_load_certificate(certificate: Union[None, bytes, str]) -> Optional[bytes]:
-        """If the certificate points to a file, return the contents (plaintext reads).
-        Else return the bytes"""
-        if not certificate:
-            return None
-
-        if isinstance(certificate, bytes):
-            return certificate
-
-        if isinstance(certificate, str):
-            with open(certificate, "rb") as secret_file:
-                return secret_file.read()
-        raise ValueError(
-            f"{certificate=} should be a path to a certificate files or bytes"
-        )
+        finalizer = self.__dict__.get("_finalizer")
+        if finalizer is not None:
+            finalizer()
 
     def models_info(self) -> list[dict[str, Any]]:
-        info_service: ServiceDescriptor = self._desc_pool.FindServiceByName(
-            "caikit.runtime.info.InfoService"
-        )
-
-        models_info: MethodDescriptor = info_service.methods_by_name["GetModelsInfo"]
-        ModelInfoRequest: Descriptor = GetMessageClass(
-            self._desc_pool.FindMessageTypeByName(models_info.input_type.full_name)
-        )
-        ModelInfoResponse: Descriptor = GetMessageClass(
-            self._desc_pool.FindMessageTypeByName(models_info.output_type.full_name)
-        )
-
-        get_models_info = self._channel.unary_unary(
-            f"/{info_service.full_name}/{models_info.name}",
-            request_serializer=ModelInfoRequest.SerializeToString,
-            response_deserializer=ModelInfoResponse.FromString,
-        )
-
-        models = get_models_info(ModelInfoRequest())
-
-        models_dict = MessageToDict(models)["models"]
-
-        # make sure that the output format matches the http client's
-        for model in models_dict:
-            model["model_path"] = model.pop("modelPath")
-            model["module_id"] = model.pop("moduleId")
-            model["module_metadata"] = model.pop("moduleMetadata")
+        _, ModelInfoRequest, _ = self._models_info_method
+        models = self._get_models_info(ModelInfoRequest())
 
-        return models_dict
+        return self._models_info_to_list(models)
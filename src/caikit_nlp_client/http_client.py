@@ -1,20 +1,167 @@
 import json
 import logging
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from typing import Any, Optional, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .utils import json_dumps, json_loads
 
 log = logging.getLogger(__name__)
 
+# payloads are serialized by the client rather than by requests' json=, which
+# goes through the stdlib json module
+_JSON_HEADERS = {"Content-Type": "application/json"}
 
-class HttpClient:
-    """HTTP client for a caikit nlp runtime server
+# statuses of requests rejected before being processed, which are retried.
+# Text generation is POSTed, so retries apply to all methods: gateway errors
+# (502, 504) are not retried, the model server may have processed the request
+_RETRY_STATUSES = frozenset({429, 503})
 
-    Args:
-        http_config (HttpConfig): Configurations to make HTTP call.
+
+# endpoints of the tasks other than text generation, under /api/v1/task/
+_TASKS = (
+    "embedding",
+    "embedding-tasks",
+    "sentence-similarity",
+    "sentence-similarity-tasks",
+    "rerank",
+    "rerank-tasks",
+)
+
+
+class _SSEDecoder:
+    """incremental parser of server-sent events, returning the data of each
+    complete event
+
+    Lines are found by scanning a single buffer rather than splitting every
+    chunk. Lines end with LF or CRLF, the data lines of an event are joined
+    with LF and the other fields (event, id, comments) are ignored.
     """
 
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._data = bytearray()
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        """parses `chunk`, returns the data of the events it completes"""
+        buffer, data = self._buffer, self._data
+        buffer += chunk
+        events = []
+        start = 0
+        while (end := buffer.find(b"\n", start)) != -1:
+            line_end = end - 1 if end > start and buffer[end - 1] == 0x0D else end
+            if line_end == start:
+                # an empty line dispatches the event
+                if data:
+                    events.append(bytes(data))
+                    data.clear()
+            elif buffer.startswith(b"data:", start, line_end):
+                value_start = start + 5
+                if buffer.startswith(b" ", value_start, line_end):
+                    value_start += 1
+                if data:
+                    data += b"\n"
+                data += buffer[value_start:line_end]
+            start = end + 1
+        del buffer[:start]
+        return events
+
+    def close(self) -> list[bytes]:
+        """returns the data of the last event, which the stream may end without
+        terminating by an empty line"""
+        return self.feed(b"\n\n")
+
+
+def _iter_sse_data(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """yields the data of each server-sent event received in `chunks`"""
+    decoder = _SSEDecoder()
+    for chunk in chunks:
+        yield from decoder.feed(chunk)
+    yield from decoder.close()
+
+
+def _stream_event_text(data: bytes) -> str:
+    """returns the generated text of a text generation stream event, raises a
+    RuntimeError for error events"""
+    message = json_loads(data)
+    if "details" in message and "code" in message:
+        raise RuntimeError(
+            "Exception iterating responses: {}".format(message["details"])
+        )
+    try:
+        return message["generated_text"]
+    except KeyError as exc:
+        raise RuntimeError(
+            "Unexpected response from the server: generated text is missing"
+        ) from exc
+
+
+def _copy_flattened(flattened: dict) -> dict:
+    """copies a flattened schema, nested schemas included"""
+    return {
+        param: _copy_flattened(value) if isinstance(value, dict) else value
+        for param, value in flattened.items()
+    }
+
+
+def _simplify_parameter_schema(
+    parameters: dict, schemas: dict, flattened_refs: Optional[dict] = None
+) -> dict:
+    """recursively flattens openapi's spec into a human-friendly dict
+
+    Schemas referenced more than once are only flattened once, their result is
+    kept in `flattened_refs` by name. Each reference gets its own copy."""
+    if flattened_refs is None:
+        flattened_refs = {}
+
+    if "$ref" in parameters["allOf"][0]:
+        value = parameters["allOf"][0]["$ref"]
+        prefix, name = value.rsplit("/", maxsplit=1)
+        assert prefix == "#/components/schemas"
+        if name in flattened_refs:
+            return _copy_flattened(flattened_refs[name])
+        params = schemas[name]["properties"]
+    else:
+        name = None
+        params = parameters["allOf"][0]["properties"]
+
+    flattened = {}
+    for param, description in params.items():
+        if "allOf" in description:
+            flattened[param] = _simplify_parameter_schema(
+                description, schemas, flattened_refs
+            )
+        else:
+            flattened[param] = description["type"]
+
+    if name is not None:
+        flattened_refs[name] = flattened
+    return flattened
+
+
+class _HttpClientBase:
+    """endpoints and TLS settings shared by the http clients"""
+
+    # clients may be created per model or per request handler, their
+    # attributes are stored in slots rather than in a __dict__
+    __slots__ = (
+        "__weakref__",
+        "_api_base",
+        "_api_url",
+        "_stream_api_url",
+        "_models_info_url",
+        "_openapi_url",
+        "_task_urls",
+        "_verify",
+        "_client_cert_path",
+        "_client_key_path",
+        "_ca_cert_path",
+        "_text_generation_schema",
+    )
+
     def __init__(
         self,
         base_url: str,
@@ -23,34 +170,6 @@ class HttpClient:
         client_cert_path: Optional[str] = None,
         client_key_path: Optional[str] = None,
     ):
-        """Client class for a Caikit NLP HTTP server
-
-        For unsecured connections:
-
-        >>> client = HttpClient("http://localhost:8080")
-
-        For TLS (https) connections:
-
-        >>> client = HttpClient("https://localhost:8080")
-
-        to skip verification of TLS certs:
-
-        >>> client = HttpClient("https://localhost:8080", verify=False)
-
-        to use a custom CA:
-
-        >>> client = HttpClient("https://localhost:8080", ca_cert_path=path)
-
-        For mTLS connections, both client_cert_path and client_key_path have to be
-        provided:
-
-        >>> client = HttpClient("https://localhost:8080",
-        >>>     ca_cert_path="path/to/ca.pem",
-        >>>     client_cert_path='path/to/client_cert.pem',
-        >>>     client_key_path='path/to/client_key.pem'
-        >>> )
-
-        """
         text_generation_endpoint = "/api/v1/task/text-generation"
         text_generation_stream_endpoint = (
             "/api/v1/task/server-streaming-text-generation"
@@ -60,6 +179,8 @@ class HttpClient:
         self._api_url = f"{base_url}{text_generation_endpoint}"
         self._stream_api_url = f"{base_url}{text_generation_stream_endpoint}"
         self._models_info_url = f"{base_url}/info/models"
+        self._openapi_url = f"{base_url}/openapi.json"
+        self._task_urls = {task: f"{base_url}/api/v1/task/{task}" for task in _TASKS}
 
         if verify is False and ca_cert_path:
             raise ValueError("Cannot use verify=False with ca_cert_path")
@@ -77,6 +198,10 @@ class HttpClient:
                 "Must provide both client_cert_path and client_key_path for mTLS"
             )
 
+        # parameters schema and components of the openapi spec, see
+        # `_parse_text_generation_schema`
+        self._text_generation_schema: Optional[tuple[dict, dict]] = None
+
     @property
     def _mtls_configured(self):
         return all((self._client_key_path, self._client_cert_path, self._ca_cert_path))
@@ -99,45 +224,188 @@ class HttpClient:
 
         return req_kwargs
 
-    def get_text_generation_parameters(
-        self,
-        timeout: float = 60.0,
-    ) -> dict:
-        """returns a dict with available fields and their type"""
-        req_kwargs = self._get_tls_configuration()
+    def _create_json_request(self, model_id, text, **kwargs) -> dict[str, Any]:
+        if kwargs:
+            return {"model_id": model_id, "inputs": text, "parameters": kwargs}
+        return {"model_id": model_id, "inputs": text}
 
-        openapi_spec = requests.get(
-            f"{self._api_base}/openapi.json",
-            timeout=timeout,
-            **req_kwargs,  # type: ignore
-        ).json()
+    def _create_task_request(
+        self, model_id: str, inputs: Any, parameters: Optional[dict[str, Any]]
+    ) -> dict[str, Any]:
+        payload = {
+            "inputs": inputs,
+            "model_id": model_id,
+        }
+        if parameters:
+            payload.update(parameters=parameters)
+        return payload
+
+    @staticmethod
+    def _parse_text_generation_schema(openapi_json: bytes) -> tuple[dict, dict]:
+        """returns the schema of the text generation parameters of an openapi
+        spec, and the schemas it may reference"""
+        openapi_spec = json_loads(openapi_json)
 
         request_schema = openapi_spec["paths"]["/api/v1/task/text-generation"]["post"][
             "requestBody"
         ]["content"]["application/json"]["schema"]
-        parameters = request_schema["properties"]["parameters"]
+        return (
+            request_schema["properties"]["parameters"],
+            openapi_spec["components"]["schemas"],
+        )
+
+    @staticmethod
+    def _response_reason(response: requests.Response) -> str:
+        return response.reason
+
+    def _unpack_or_raise_details(self, response, details_field=None) -> dict[str, Any]:
+        """
+        The details_field is present because there seems to be an inconsistent
+        naming of this field between different endpoints.
+        Some have "details" while others have "detail".
+
+        See the following issue: https://github.com/caikit/caikit/issues/750
+
+        When details_field == None, try to detect the right name of the details field.
+        """
+        if response.status_code == 200:
+            return json_loads(response.content)
+
+        try:
+            body = json_loads(response.content)
+            if details_field is None:
+                details_field = "details" if "details" in body else "detail"
+            details = body[details_field]
+        except json.JSONDecodeError:
+            details = f"{self._response_reason(response)} {response.text=}"
+
+        raise RuntimeError(f"{response.status_code=} {details}")
+
+
+class HttpClient(_HttpClientBase):
+    """HTTP client for a caikit nlp runtime server
+
+    Args:
+        http_config (HttpConfig): Configurations to make HTTP call.
+    """
+
+    __slots__ = ("_tls_kwargs", "_session")
+
+    def __init__(
+        self,
+        base_url: str,
+        verify: Optional[bool] = None,
+        ca_cert_path: Optional[str] = None,
+        client_cert_path: Optional[str] = None,
+        client_key_path: Optional[str] = None,
+        *,
+        pool_maxsize: int = 10,
+        max_retries: int = 3,
+        backoff_factor: float = 0.2,
+    ):
+        """Client class for a Caikit NLP HTTP server
+
+        For unsecured connections:
+
+        >>> client = HttpClient("http://localhost:8080")
+
+        For TLS (https) connections:
+
+        >>> client = HttpClient("https://localhost:8080")
+
+        to skip verification of TLS certs:
+
+        >>> client = HttpClient("https://localhost:8080", verify=False)
+
+        to use a custom CA:
+
+        >>> client = HttpClient("https://localhost:8080", ca_cert_path=path)
+
+        For mTLS connections, both client_cert_path and client_key_path have to be
+        provided:
+
+        >>> client = HttpClient("https://localhost:8080",
+        >>>     ca_cert_path="path/to/ca.pem",
+        >>>     client_cert_path='path/to/client_cert.pem',
+        >>>     client_key_path='path/to/client_key.pem'
+        >>> )
+
+        Connections are kept alive and reused across requests. Up to
+        `pool_maxsize` connections are kept open, raise it when sharing the
+        client between more threads:
 
-        def simplify_parameter_schema(parameters: dict) -> dict:
-            """recursively flattens openapi's spec into a human-friendly dict"""
+        >>> client = HttpClient("http://localhost:8080", pool_maxsize=32)
 
-            if "$ref" in parameters["allOf"][0]:
-                value = parameters["allOf"][0]["$ref"]
-                prefix, name = value.rsplit("/", maxsplit=1)
-                assert prefix == "#/components/schemas"
-                params = openapi_spec["components"]["schemas"][name]["properties"]
-            else:
-                params = parameters["allOf"][0]["properties"]
+        Requests answered with 429 or 503 are retried up to
+        `max_retries` times, waiting for the server's Retry-After or an
+        exponential backoff starting from `backoff_factor` seconds. To disable
+        retries:
 
-            flattened = {}
-            for param, description in params.items():
-                if "allOf" in description:
-                    flattened[param] = simplify_parameter_schema(description)
-                else:
-                    flattened[param] = description["type"]
+        >>> client = HttpClient("http://localhost:8080", max_retries=0)
+        """
+        super().__init__(
+            base_url,
+            verify=verify,
+            ca_cert_path=ca_cert_path,
+            client_cert_path=client_cert_path,
+            client_key_path=client_key_path,
+        )
+
+        if pool_maxsize < 1:
+            raise ValueError("pool_maxsize must be a positive integer")
+
+        # the TLS settings don't change, they are passed as is to every request
+        self._tls_kwargs = self._get_tls_configuration()
+
+        # connections are kept alive and reused across requests
+        self._session = requests.Session()
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=_RETRY_STATUSES,
+            allowed_methods=None,
+            # the request may have reached the server: read errors are raised
+            # as is, and are not retried (e.g. generation running twice)
+            read=False,
+            other=0,
+            # the last response is returned, so that its error details are raised
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=pool_maxsize, max_retries=retry
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def close(self):
+        """closes the connections of the client"""
+        self._session.close()
 
-            return flattened
+    def __enter__(self):
+        return self
 
-        return simplify_parameter_schema(parameters)
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def get_text_generation_parameters(
+        self,
+        timeout: float = 60.0,
+    ) -> dict:
+        """returns a dict with available fields and their type
+
+        The openapi spec of the server is only fetched by the first call."""
+        if self._text_generation_schema is None:
+            response = self._session.get(
+                self._openapi_url,
+                timeout=timeout,
+                **self._tls_kwargs,  # type: ignore
+            )
+            self._text_generation_schema = self._parse_text_generation_schema(
+                response.content
+            )
+
+        # flattening is cheaper than copying a cached result
+        return _simplify_parameter_schema(*self._text_generation_schema)
 
     def generate_text(
         self,
@@ -176,27 +444,26 @@ class HttpClient:
         if not model_id:
             raise ValueError("request must have a model id")
 
-        log.info(f"Calling generate_text for '{model_id}'")
+        log.info("Calling generate_text for '%s'", model_id)
         json_input = self._create_json_request(
             model_id,
             text,
             **kwargs,
         )
 
-        req_kwargs = self._get_tls_configuration()
-
-        response = requests.post(
+        response = self._session.post(
             self._api_url,
-            json=json_input,
+            data=json_dumps(json_input),
+            headers=_JSON_HEADERS,
             timeout=timeout,
-            **req_kwargs,  # type: ignore
+            **self._tls_kwargs,  # type: ignore
         )
-        log.debug(f"Response: {response}")
+        log.debug("Response: %s", response)
         if response.status_code == 200:
-            return response.json()["generated_text"]
+            return json_loads(response.content)["generated_text"]
 
         try:
-            details = response.json()["details"]
+            details = json_loads(response.content)["details"]
         except json.JSONDecodeError:
             details = f"{response.reason} {response.text=}"
 
@@ -208,7 +475,7 @@ class HttpClient:
         text: str,
         timeout: float = 60.0,
         **kwargs,
-    ) -> Iterable[str]:
+    ) -> Iterator[str]:
         """Queries the `text-generation` stream endpoint for the given model_id
 
         Args:
@@ -227,7 +494,7 @@ class HttpClient:
             the text generation request
 
         Returns:
-            a list of messages generated from the server
+            an iterator over the generated text (tokens), as they are received
 
         Example:
 
@@ -245,116 +512,70 @@ class HttpClient:
         if not model_id:
             raise ValueError("request must have a model id")
 
-        log.info(f"Calling generate_text_stream for '{model_id}'")
+        log.info("Calling generate_text_stream for '%s'", model_id)
 
-        payload: dict[str, Any] = {
-            "model_id": model_id,
-            "inputs": text,
-        }
-        if kwargs:
-            payload["parameters"] = kwargs
-
-        req_kwargs = self._get_tls_configuration()
+        payload = self._create_json_request(model_id, text, **kwargs)
 
-        response = requests.post(
+        # the response is closed when the stream ends, fails or is dropped by the
+        # consumer, so that its connection goes back to the pool
+        with self._session.post(
             self._stream_api_url,
-            json=payload,
+            data=json_dumps(payload),
+            headers=_JSON_HEADERS,
             timeout=timeout,
             stream=True,
-            **req_kwargs,  # type: ignore
-        )
-        log.debug(f"Response: {response}")
-        buffer: list[bytes] = []
-        for line in response.iter_lines():
-            if line:
-                if line.startswith(b"data: "):
-                    buffer.append(line[6:])
-                    continue
-                if line.startswith(b"event: message"):
-                    assert not line[14:]
-                    continue
-                if line.startswith(b"event: error"):
-                    assert not line[12:]
-                    continue
-
-            try:
-                message = json.loads(b"".join(buffer))
-            except json.JSONDecodeError:
-                # message not over yet
-                continue
-
-            buffer.clear()
-            if "details" in message and "code" in message:
-                raise RuntimeError(
-                    "Exception iterating responses: {}".format(message["details"])
-                )
-            yield message["generated_text"]
-        if buffer:
-            final_message = json.loads(b"".join(buffer))
-            if "details" in final_message and "code" in final_message:
-                raise RuntimeError(
-                    "Exception iterating responses: {}".format(final_message["details"])
-                )
-            try:
-                yield final_message["generated_text"]
-            except KeyError as exc:
-                raise RuntimeError(
-                    "Unexpected response from the server: generated text is missing"
-                ) from exc
-
-    def _create_json_request(self, model_id, text, **kwargs) -> dict[str, Any]:
-        payload = {
-            "model_id": model_id,
-            "inputs": text,
-        }
-        if kwargs:
-            payload.update(parameters=kwargs)
-        return payload
+            **self._tls_kwargs,  # type: ignore
+        ) as response:
+            log.debug("Response: %s", response)
+            # chunk_size=None yields the data as soon as it is received
+            for data in _iter_sse_data(response.iter_content(chunk_size=None)):
+                yield _stream_event_text(data)
 
     def models_info(
         self,
         timeout: float = 60.0,
-    ) -> dict[str, list[dict[str, Any]]]:
-        req_kwargs = self._get_tls_configuration()
-
-        response = requests.get(
+    ) -> list[dict[str, Any]]:
+        response = self._session.get(
             self._models_info_url,
             timeout=timeout,
-            **req_kwargs,  # type: ignore
+            **self._tls_kwargs,  # type: ignore
         )
         response.raise_for_status()
 
-        return response.json()["models"]
+        return json_loads(response.content)["models"]
 
-    def embedding(
+    def _task_post(
         self,
+        task: str,
         model_id: str,
-        text: str,
-        timeout: float = 60.0,
-        parameters: Optional[dict[str, Any]] = None,
+        inputs: Any,
+        timeout: float,
+        parameters: Optional[dict[str, Any]],
     ) -> dict[str, Any]:
+        """posts a request to the endpoint of `task`, returns the response"""
         if not model_id:
             raise ValueError("request must have a model id")
 
-        log.info(f"Calling embedding for '{model_id}'")
-        json_input: dict[str, Any] = {
-            "inputs": text,
-            "model_id": model_id,
-        }
-        if parameters:
-            json_input.update(parameters=parameters)
-
-        req_kwargs = self._get_tls_configuration()
-
-        response = requests.post(
-            f"{self._api_base}/api/v1/task/embedding",
-            json=json_input,
+        log.info("Calling %s for '%s'", task, model_id)
+        response = self._session.post(
+            self._task_urls[task],
+            data=json_dumps(self._create_task_request(model_id, inputs, parameters)),
+            headers=_JSON_HEADERS,
             timeout=timeout,
-            **req_kwargs,  # type: ignore
+            **self._tls_kwargs,  # type: ignore
         )
-        log.debug(f"Response: {response}")
+        log.debug("Response: %s", response)
         return self._unpack_or_raise_details(response)
 
+    def embedding(
+        self,
+        model_id: str,
+        text: str,
+        timeout: float = 60.0,
+        parameters: Optional[dict[str, Any]] = None,
+    ) -> dict[str, Any]:
+        return self._task_post("embedding", model_id, text, timeout, parameters)
+
     def embedding_tasks(
         self,
         model_id: str,
@@ -362,27 +583,7 @@ class HttpClient:
         timeout: float = 60.0,
         parameters: Optional[dict[str, Any]] = None,
     ) -> dict[str, Any]:
-        if not model_id:
-            raise ValueError("request must have a model id")
-
-        log.info(f"Calling embedding_tasks for '{model_id}'")
-        json_input: dict[str, Any] = {
-            "inputs": texts,
-            "model_id": model_id,
-        }
-        if parameters:
-            json_input.update(parameters=parameters)
-
-        req_kwargs = self._get_tls_configuration()
-
-        response = requests.post(
-            f"{self._api_base}/api/v1/task/embedding-tasks",
-            json=json_input,
-            timeout=timeout,
-            **req_kwargs,  # type: ignore
-        )
-        log.debug(f"Response: {response}")
-        return self._unpack_or_raise_details(response)
+        return self._task_post("embedding-tasks", model_id, texts, timeout, parameters)
 
     def sentence_similarity(
         self,
@@ -392,30 +593,10 @@ class HttpClient:
         timeout: float = 60.0,
         parameters: Optional[dict[str, Any]] = None,
     ) -> dict[str, Any]:
-        if not model_id:
-            raise ValueError("request must have a model id")
-
-        log.info(f"Calling sentence_similarity for '{model_id}'")
-        json_input = {
-            "inputs": {
-                "source_sentence": source_sentence,
-                "sentences": sentences,
-            },
-            "model_id": model_id,
-        }
-        if parameters:
-            json_input.update(parameters=parameters)
-
-        req_kwargs = self._get_tls_configuration()
-
-        response = requests.post(
-            f"{self._api_base}/api/v1/task/sentence-similarity",
-            json=json_input,
-            timeout=timeout,
-            **req_kwargs,  # type: ignore
+        inputs = {"source_sentence": source_sentence, "sentences": sentences}
+        return self._task_post(
+            "sentence-similarity", model_id, inputs, timeout, parameters
         )
-        log.debug(f"Response: {response}")
-        return self._unpack_or_raise_details(response)
 
     def sentence_similarity_tasks(
         self,
@@ -425,30 +606,10 @@ class HttpClient:
         timeout: float = 60.0,
         parameters: Optional[dict[str, Any]] = None,
     ) -> dict[str, Any]:
-        if not model_id:
-            raise ValueError("request must have a model id")
-
-        log.info(f"Calling sentence_similarity_tasks for '{model_id}'")
-        json_input = {
-            "inputs": {
-                "source_sentences": source_sentences,
-                "sentences": sentences,
-            },
-            "model_id": model_id,
-        }
-        if parameters:
-            json_input.update(parameters=parameters)
-
-        req_kwargs = self._get_tls_configuration()
-
-        response = requests.post(
-            f"{self._api_base}/api/v1/task/sentence-similarity-tasks",
-            json=json_input,
-            timeout=timeout,
-            **req_kwargs,  # type: ignore
+        inputs = {"source_sentences": source_sentences, "sentences": sentences}
+        return self._task_post(
+            "sentence-similarity-tasks", model_id, inputs, timeout, parameters
         )
-        log.debug(f"Response: {response}")
-        return self._unpack_or_raise_details(response)
 
     def rerank(
         self,
@@ -458,30 +619,8 @@ class HttpClient:
         timeout: float = 60.0,
         parameters: Optional[dict[str, Any]] = None,
     ) -> dict[str, Any]:
-        if not model_id:
-            raise ValueError("request must have a model id")
-
-        log.info(f"Calling rerank for '{model_id}'")
-        json_input = {
-            "inputs": {
-                "documents": documents,
-                "query": query,
-            },
-            "model_id": model_id,
-        }
-        if parameters:
-            json_input.update(parameters=parameters)
-
-        req_kwargs = self._get_tls_configuration()
-
-        response = requests.post(
-            f"{self._api_base}/api/v1/task/rerank",
-            json=json_input,
-            timeout=timeout,
-            **req_kwargs,  # type: ignore
-        )
-        log.debug(f"Response: {response}")
-        return self._unpack_or_raise_details(response)
+        inputs = {"documents": documents, "query": query}
+        return self._task_post("rerank", model_id, inputs, timeout, parameters)
 
     def rerank_tasks(
         self,
@@ -491,51 +630,5 @@ class HttpClient:
         timeout: float = 60.0,
         parameters: Optional[dict[str, Any]] = None,
     ) -> dict[str, Any]:
-        if not model_id:
-            raise ValueError("request must have a model id")
-
-        log.info(f"Calling rerank_tasks for '{model_id}'")
-        json_input = {
-            "inputs": {
-                "documents": documents,
-                "queries": queries,
-            },
-            "model_id": model_id,
-        }
-        if parameters:
-            json_input.update(parameters=parameters)
-
-        req_kwargs = self._get_tls_configuration()
-
-        response = requests.post(
-            f"{self._api_base}/api/v1/task/rerank-tasks",
-            json=json_input,
-            timeout=timeout,
-            **req_kwargs,  # type: ignore
-        )
-        log.debug(f"Response: {response}")
-        return self._unpack_or_raise_details(response)
-
-    def _unpack_or_raise_details(
-        self, response: requests.Response, details_field=None
-    ) -> dict[str, Any]:
-        """
-        The details_field is present because there seems to be an inconsistent
-        naming of this field between different endpoints.
-        Some have "details" while others have "detail".
-
-        See the following issue: https://github.com/caikit/caikit/issues/750
-
-        When details_field == None, try to detect the right name of the details field.
-        """
-        if response.status_code == 200:
-            return response.json()
-
-        try:
-            if details_field is None:
-                details_field = "details" if "details" in response.json() else "detail"
-            details = response.json()[details_field]
-        except json.JSONDecodeError:
-            details = f"{response.reason} {response.text=}"
-
-        raise RuntimeError(f"{response.status_code=} {details}")
+        inputs = {"documents": documents, "queries": queries}
+        return self._task_post("rerank-tasks", model_id, inputs, timeout, parameters)
@@ -1,27 +1,56 @@
+import json
 import socket
 import ssl
-import sys
+from functools import lru_cache
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
+def json_dumps(obj: Any) -> bytes:
+    """serializes `obj` to compact utf-8 encoded json, using orjson when
+    installed"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def json_loads(data: Union[bytes, bytearray, str]) -> Any:
+    """parses json from bytes or str, using orjson when installed
+
+    Both raise a subclass of `json.JSONDecodeError` for invalid json.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@lru_cache(maxsize=1)
+def _probe_context() -> ssl.SSLContext:
+    """TLS context used to fetch server certificates, shared across calls"""
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    # the certificate is retrieved, not verified
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+    return context
 
 
 def get_server_certificate(host: str, port: int) -> str:
     """connect to host:port and get the certificate it presents
 
-    This is almost the same as `ssl.get_server_certificate`, but
-    when opening the TLS socket, `server_hostname` is also provided.
+    This is almost the same as `ssl.get_server_certificate`: the TLS socket
+    is opened with `server_hostname` (SNI) on every python version, and with
+    a single unverified TLS context shared across calls.
 
     This retrieves the correct certificate for hosts using name-based
     virtual hosting.
     """
-    if sys.version_info >= (3, 10):
-        # ssl.get_server_certificate supports TLS SNI only above 3.10
-        # https://github.com/python/cpython/pull/16820
-        return ssl.get_server_certificate((host, port))
-
-    context = ssl.SSLContext()
-
     with (
         socket.create_connection((host, port)) as sock,
-        context.wrap_socket(sock, server_hostname=host) as ssock,
+        _probe_context().wrap_socket(sock, server_hostname=host) as ssock,
     ):
         cert_der = ssock.getpeercert(binary_form=True)
 
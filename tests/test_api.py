@@ -2,6 +2,36 @@ def test_module():
     import caikit_nlp_client
 
     assert set(caikit_nlp_client.__all__) == {
+        "AsyncGrpcClient",
+        "AsyncHttpClient",
         "GrpcClient",
         "HttpClient",
     }
+
+
+def test_lazy_imports():
+    import subprocess
+    import sys
+
+    code = (
+        "import sys; import caikit_nlp_client; "
+        "assert 'grpc' not in sys.modules; "
+        "from caikit_nlp_client import HttpClient; "
+        "assert 'grpc' not in sys.modules; "
+        "from caikit_nlp_client import GrpcClient; "
+        "assert 'grpc' in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_missing_httpx():
+    import subprocess
+    import sys
+
+    code = (
+        "import sys; sys.modules['httpx'] = None; "
+        "from caikit_nlp_client import *; "
+        "import pytest; "
+        "pytest.raises(ImportError, AsyncHttpClient, 'http://localhost:8080')"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
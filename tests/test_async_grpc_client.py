@@ -0,0 +1,135 @@
+import asyncio
+
+import grpc
+import pytest
+
+from caikit_nlp_client import AsyncGrpcClient
+from caikit_nlp_client.grpc_client import _message_classes_cache
+
+from .fixtures.utils import ConnectionType
+
+
+@pytest.mark.parametrize("connection_type", [ConnectionType.INSECURE], scope="session")
+def test_generate_text(grpc_server, connection_type, model_name, prompt):
+    async def generate():
+        async with AsyncGrpcClient(*grpc_server, insecure=True) as client:
+            return await client.generate_text(model_name, prompt)
+
+    generated_text = asyncio.run(generate())
+    assert isinstance(generated_text, str)
+    assert generated_text
+
+
+@pytest.mark.parametrize("connection_type", [ConnectionType.INSECURE], scope="session")
+def test_generate_text_stream(grpc_server, connection_type, model_name, prompt):
+    async def generate():
+        async with AsyncGrpcClient(*grpc_server, insecure=True) as client:
+            return [
+                text async for text in client.generate_text_stream(model_name, prompt)
+            ]
+
+    response_list = asyncio.run(generate())
+    assert response_list
+    assert all(isinstance(text, str) for text in response_list)
+
+
+@pytest.mark.parametrize("connection_type", [ConnectionType.INSECURE], scope="session")
+def test_generate_text_stream_coalesce(
+    grpc_server, connection_type, model_name, prompt
+):
+    async def generate(**kwargs):
+        async with AsyncGrpcClient(*grpc_server, insecure=True) as client:
+            chunks = []
+            async for chunk in client.generate_text_stream(
+                model_name, prompt, **kwargs
+            ):
+                chunks.append(chunk)
+                # slow consumer, chunks received in the meantime are joined
+                await asyncio.sleep(0.01)
+            return chunks
+
+    chunks = asyncio.run(generate())
+    coalesced_chunks = asyncio.run(generate(coalesce=True))
+    assert "".join(coalesced_chunks) == "".join(chunks)
+    assert len(coalesced_chunks) <= len(chunks)
+
+
+@pytest.mark.parametrize("connection_type", [ConnectionType.INSECURE], scope="session")
+def test_concurrent_requests(grpc_server, connection_type, model_name, prompt):
+    async def generate():
+        async with AsyncGrpcClient(*grpc_server, insecure=True, pool_size=2) as client:
+            return await asyncio.gather(
+                *(client.generate_text(model_name, prompt) for _ in range(4))
+            )
+
+    assert all(asyncio.run(generate()))
+
+
+@pytest.mark.parametrize("connection_type", [ConnectionType.INSECURE], scope="session")
+def test_request_exception_handling(
+    grpc_server, connection_type, using_real_caikit, mock_text_generation, model_name
+):
+    if using_real_caikit:
+        prompt, kwargs, detail = "dummy", {"min_new_tokens": -1}, "Value out of range"
+    else:
+        prompt, kwargs, detail = (
+            "[[raise exception]] dummy",
+            {},
+            "user requested an exception",
+        )
+
+    async def generate():
+        async with AsyncGrpcClient(*grpc_server, insecure=True) as client:
+            with pytest.raises(RuntimeError, match=detail):
+                await client.generate_text(model_name, prompt, **kwargs)
+            with pytest.raises(RuntimeError, match=detail):
+                async for _ in client.generate_text_stream(
+                    model_name, prompt, **kwargs
+                ):
+                    pass
+            with pytest.raises(RuntimeError, match=detail):
+                async for _ in client.generate_text_stream(
+                    model_name, prompt, coalesce=True, **kwargs
+                ):
+                    pass
+
+    asyncio.run(generate())
+
+
+@pytest.mark.parametrize("connection_type", [ConnectionType.INSECURE], scope="session")
+def test_models_info(grpc_server, connection_type, using_real_caikit):
+    async def models_info():
+        async with AsyncGrpcClient(*grpc_server, insecure=True) as client:
+            return await client.models_info()
+
+    models_info = asyncio.run(models_info())
+    assert len(models_info) == (1 if using_real_caikit else 4)
+    assert all("model_path" in model for model in models_info)
+
+
+@pytest.mark.parametrize("connection_type", [ConnectionType.INSECURE], scope="session")
+def test_lazy_reflection(grpc_server, connection_type, model_name, prompt, mocker):
+    mocker.patch.dict(_message_classes_cache, clear=True)
+    to_thread = mocker.spy(asyncio, "to_thread")
+    insecure_channel = mocker.spy(grpc, "insecure_channel")
+    option = ("grpc.max_receive_message_length", 8 * 1024 * 1024)
+
+    async def generate():
+        async with AsyncGrpcClient(
+            *grpc_server,
+            insecure=True,
+            channel_options=[option],
+        ) as client:
+            # the constructor doesn't block on reflection queries
+            assert not _message_classes_cache
+            to_thread.assert_not_called()
+
+            generated_text = await client.generate_text(model_name, prompt)
+            to_thread.assert_called_once()
+            # the reflection channel uses the channel options too
+            (_, kwargs), *_ = insecure_channel.call_args_list
+            assert option in kwargs["options"]
+            return generated_text
+
+    assert asyncio.run(generate())
+    assert _message_classes_cache
@@ -0,0 +1,185 @@
+import asyncio
+
+import pytest
+
+from caikit_nlp_client import AsyncHttpClient
+
+from .fixtures.utils import ConnectionType
+
+
+@pytest.fixture
+def async_http_url(http_server):
+    host, port = http_server
+    return f"http://{host}:{port}"
+
+
+@pytest.mark.parametrize("connection_type", [ConnectionType.INSECURE], scope="session")
+def test_generate_text(async_http_url, connection_type, model_name, prompt):
+    async def generate():
+        async with AsyncHttpClient(async_http_url) as client:
+            return await client.generate_text(model_name, prompt, max_new_tokens=20)
+
+    generated_text = asyncio.run(generate())
+    assert isinstance(generated_text, str)
+    assert generated_text
+
+
+@pytest.mark.parametrize("connection_type", [ConnectionType.INSECURE], scope="session")
+def test_generate_text_stream(async_http_url, connection_type, model_name, prompt):
+    async def generate():
+        async with AsyncHttpClient(async_http_url) as client:
+            return [
+                text async for text in client.generate_text_stream(model_name, prompt)
+            ]
+
+    response_list = asyncio.run(generate())
+    assert response_list
+    assert all(isinstance(text, str) for text in response_list)
+
+
+@pytest.mark.parametrize("connection_type", [ConnectionType.INSECURE], scope="session")
+def test_generate_text_stream_batch(
+    async_http_url, connection_type, model_name, prompt
+):
+    prompts = [f"{prompt} {i}" for i in range(4)]
+
+    async def generate():
+        async with AsyncHttpClient(async_http_url) as client:
+            batch = [
+                item
+                async for item in client.generate_text_stream_batch(
+                    model_name, prompts, max_in_flight=2
+                )
+            ]
+            single = [
+                [text async for text in client.generate_text_stream(model_name, p)]
+                for p in prompts
+            ]
+            return batch, single
+
+    batch, single = asyncio.run(generate())
+    streams: list[list[str]] = [[] for _ in prompts]
+    for index, text in batch:
+        streams[index].append(text)
+    assert streams == single
+
+    with pytest.raises(ValueError, match="max_in_flight"):
+        asyncio.run(
+            AsyncHttpClient(async_http_url)
+            .generate_text_stream_batch(model_name, prompts, max_in_flight=0)
+            .__anext__()
+        )
+
+
+@pytest.mark.parametrize("connection_type", [ConnectionType.INSECURE], scope="session")
+def test_concurrent_requests(async_http_url, connection_type, model_name, prompt):
+    async def generate():
+        async with AsyncHttpClient(async_http_url) as client:
+            return await asyncio.gather(
+                *(client.generate_text(model_name, f"{prompt} {i}") for i in range(4))
+            )
+
+    generated_texts = asyncio.run(generate())
+    assert len(generated_texts) == 4
+    assert all(generated_texts)
+
+
+@pytest.mark.parametrize("connection_type", [ConnectionType.INSECURE], scope="session")
+def test_request_exception_handling(
+    async_http_url, connection_type, using_real_caikit, mock_text_generation, model_name
+):
+    if using_real_caikit:
+        prompt, kwargs, detail = "dummy", {"min_new_tokens": -1}, "Value out of range"
+    else:
+        prompt, kwargs, detail = (
+            "[[raise exception]] dummy",
+            {},
+            "user requested an exception",
+        )
+
+    async def generate():
+        async with AsyncHttpClient(async_http_url) as client:
+            with pytest.raises(RuntimeError, match=f"status_code=400.*{detail}"):
+                await client.generate_text(model_name, prompt, **kwargs)
+            if using_real_caikit:
+                # stream mocking is broken, see
+                # https://github.com/opendatahub-io/caikit-nlp-client/issues/46
+                with pytest.raises(RuntimeError, match=detail):
+                    async for _ in client.generate_text_stream(
+                        model_name, prompt, **kwargs
+                    ):
+                        pass
+
+    asyncio.run(generate())
+
+
+@pytest.mark.parametrize("connection_type", [ConnectionType.INSECURE], scope="session")
+def test_models_info(async_http_url, connection_type, using_real_caikit):
+    async def models_info():
+        async with AsyncHttpClient(async_http_url) as client:
+            return await client.models_info()
+
+    models_info = asyncio.run(models_info())
+    assert len(models_info) == (1 if using_real_caikit else 4)
+    assert all("model_path" in model for model in models_info)
+
+
+@pytest.mark.parametrize("connection_type", [ConnectionType.INSECURE], scope="session")
+def test_http2(async_http_url, connection_type, model_name, prompt):
+    async def generate():
+        # plain http servers are reached over HTTP/1.1
+        async with AsyncHttpClient(async_http_url, http2=True) as client:
+            return await client.generate_text(model_name, prompt)
+
+    assert asyncio.run(generate())
+
+
+@pytest.mark.parametrize("connection_type", [ConnectionType.INSECURE], scope="session")
+def test_get_text_generation_parameters(async_http_url, connection_type, http_client):
+    async def get_parameters():
+        async with AsyncHttpClient(async_http_url) as client:
+            return await client.get_text_generation_parameters()
+
+    assert asyncio.run(get_parameters()) == http_client.get_text_generation_parameters()
+
+
+@pytest.mark.parametrize("connection_type", [ConnectionType.INSECURE], scope="session")
+def test_embedding_tasks(
+    async_http_url, connection_type, embedding_model_name, using_real_caikit
+):
+    if using_real_caikit:
+        pytest.skip(reason="embeddings endpoint does not work with caikit+tgis")
+
+    async def embed():
+        async with AsyncHttpClient(async_http_url) as client:
+            return await asyncio.gather(
+                client.embedding(embedding_model_name, "Sample text"),
+                client.embedding_tasks(
+                    embedding_model_name, ["Sample text", "Sample text 2"]
+                ),
+            )
+
+    embedding, embedding_tasks = asyncio.run(embed())
+    assert "values" in embedding["result"]["data"]
+    assert "results" in embedding_tasks
+
+
+@pytest.mark.parametrize("connection_type", [ConnectionType.INSECURE], scope="session")
+def test_sentence_similarity_and_rerank(
+    async_http_url, connection_type, embedding_model_name, using_real_caikit
+):
+    if using_real_caikit:
+        pytest.skip(reason="embeddings endpoint does not work with caikit+tgis")
+
+    async def query():
+        async with AsyncHttpClient(async_http_url) as client:
+            return await asyncio.gather(
+                client.sentence_similarity(
+                    embedding_model_name, "source text", ["source sent", "source tex"]
+                ),
+                client.rerank(embedding_model_name, [{"doc1": 1}], "doc"),
+            )
+
+    similarity, rerank = asyncio.run(query())
+    assert len(similarity["result"]["scores"]) == 2
+    assert "document" in rerank["result"]["scores"][0]
@@ -1,8 +1,11 @@
+import gc
+import os
 from types import GeneratorType
 
+import grpc
 import pytest
 
-from caikit_nlp_client.grpc_client import GrpcClient
+from caikit_nlp_client.grpc_client import GrpcClient, _message_classes_cache
 
 from .fixtures.utils import ConnectionType
 
@@ -41,6 +44,125 @@ def test_context_manager(mocker, grpc_server, connection_type, request, model_na
     channel_close_spy.assert_called()
 
 
+@pytest.mark.parametrize("connection_type", [ConnectionType.INSECURE], scope="session")
+def test_channels_closed_on_garbage_collection(
+    mocker, grpc_server, connection_type, model_name
+):
+    client = GrpcClient(*grpc_server, insecure=True)
+    assert client.generate_text(model_name, "dummy text")
+    channel_close_spy = mocker.spy(client._channel, "close")
+
+    del client
+    gc.collect()
+
+    channel_close_spy.assert_called_once()
+
+
+@pytest.mark.parametrize("connection_type", [ConnectionType.INSECURE], scope="session")
+def test_channel_pool(grpc_server, connection_type, model_name):
+    with GrpcClient(*grpc_server, insecure=True, pool_size=2) as client:
+        assert len(client._channels) == 2
+
+        assert [client._next_index() for _ in range(3)] == [0, 1, 0]
+
+        assert client.generate_text(model_name, "dummy text")
+        # stubs are only created for the methods that are called
+        assert "_streaming_task_predict" not in vars(client)
+        assert list(client.generate_text_stream(model_name, "dummy text"))
+
+
+@pytest.mark.parametrize("connection_type", [ConnectionType.INSECURE], scope="session")
+def test_compression(grpc_server, connection_type, model_name):
+    with GrpcClient(
+        *grpc_server, insecure=True, compression=grpc.Compression.Gzip
+    ) as client:
+        assert client.generate_text(model_name, "dummy text")
+        assert list(client.generate_text_stream(model_name, "dummy text"))
+
+
+@pytest.mark.parametrize("connection_type", [ConnectionType.INSECURE], scope="session")
+def test_channel_options(grpc_server, connection_type, model_name):
+    with GrpcClient(
+        *grpc_server,
+        insecure=True,
+        channel_options=[("grpc.keepalive_time_ms", 60 * 1000)],
+    ) as client:
+        assert client._channel_options["grpc.keepalive_time_ms"] == 60 * 1000
+        assert "grpc.max_receive_message_length" in client._channel_options
+        assert client.generate_text(model_name, "dummy text")
+
+
+@pytest.mark.parametrize("connection_type", [ConnectionType.INSECURE], scope="session")
+def test_message_classes_cache(grpc_server, connection_type, model_name):
+    GrpcClient(*grpc_server, insecure=True)
+
+    # the message classes were resolved by the previous client
+    client = GrpcClient(*grpc_server, insecure=True)
+    assert "_desc_pool" not in vars(client)
+    assert client.generate_text(model_name, "dummy text")
+
+    # the cache is keyed by server only, credentials are not kept alive by it
+    host, port = grpc_server
+    assert (host, port) in _message_classes_cache
+
+
+@pytest.mark.parametrize("connection_type", [ConnectionType.INSECURE], scope="session")
+def test_message_classes_cache_size(mocker, grpc_server, connection_type):
+    from caikit_nlp_client.grpc_client import _MESSAGE_CLASSES_CACHE_SIZE
+
+    host, port = grpc_server
+    mocker.patch.dict(
+        _message_classes_cache,
+        {(host, -i): () for i in range(_MESSAGE_CLASSES_CACHE_SIZE)},
+        clear=True,
+    )
+
+    GrpcClient(host, port, insecure=True)
+    assert len(_message_classes_cache) == _MESSAGE_CLASSES_CACHE_SIZE
+    assert (host, 0) not in _message_classes_cache
+    assert (host, port) in _message_classes_cache
+
+
+def test_generate_text_batch(model_name, grpc_client, prompt, mocker):
+    texts = [f"{prompt} {i}" for i in range(5)]
+    generated_texts = grpc_client.generate_text_batch(model_name, texts)
+
+    assert len(generated_texts) == len(texts)
+    assert all(isinstance(text, str) and text for text in generated_texts)
+    assert grpc_client.generate_text_batch(model_name, []) == []
+
+    with pytest.raises(ValueError, match="Unsupported kwarg key='invalid_kwarg'"):
+        grpc_client.generate_text_batch(model_name, texts, invalid_kwarg=42)
+
+    # no request is sent when one of them can't be built
+    next_index = mocker.spy(grpc_client, "_next_index")
+    with pytest.raises(TypeError):
+        grpc_client.generate_text_batch(model_name, [prompt, 42])
+    next_index.assert_not_called()
+
+
+@pytest.mark.parametrize("connection_type", [ConnectionType.TLS], scope="session")
+def test_credentials_cache(grpc_server, connection_type, ca_cert_file):
+    client = GrpcClient(*grpc_server, ca_cert=ca_cert_file)
+    other_client = GrpcClient(*grpc_server, ca_cert=ca_cert_file)
+    assert client._credentials is other_client._credentials
+
+
+@pytest.mark.parametrize("connection_type", [ConnectionType.INSECURE], scope="session")
+def test_message_classes_single_reflection_request(
+    mocker, grpc_server, connection_type
+):
+    from grpc_reflection.v1alpha.proto_reflection_descriptor_database import (
+        ProtoReflectionDescriptorDatabase,
+    )
+
+    mocker.patch.dict(_message_classes_cache, clear=True)
+    request_spy = mocker.spy(ProtoReflectionDescriptorDatabase, "_do_one_request")
+
+    GrpcClient(*grpc_server, insecure=True)
+    assert request_spy.call_count == 1
+
+
 def test_generate_text_with_no_model_id(grpc_client):
     with pytest.raises(ValueError, match="request must have a model id"):
         grpc_client.generate_text("", "What does foobar mean?")
@@ -153,6 +275,10 @@ def test_get_text_generation_parameters(grpc_client):
     }
     assert params == expected_params
 
+    # callers get their own dict
+    params["exponential_decay_length_penalty"].clear()
+    assert grpc_client.get_text_generation_parameters() == expected_params
+
 
 def test_models_info(grpc_client, using_real_caikit):
     models_info = grpc_client.models_info()
@@ -170,11 +296,19 @@ def test_models_info(grpc_client, using_real_caikit):
     )
     assert all(field in model for field in required_fields for model in models_info)
 
+    # the method is resolved once, later calls reuse the stub
+    get_models_info = grpc_client._get_models_info
+    assert grpc_client.models_info() == models_info
+    assert grpc_client._get_models_info is get_models_info
+
 
 def test_invalid_init_options(grpc_server):
     with pytest.raises(ValueError, match="insecure cannot be used with verify"):
         GrpcClient(*grpc_server, insecure=True, verify=True)
 
+    with pytest.raises(ValueError, match="pool_size must be a positive integer"):
+        GrpcClient(*grpc_server, insecure=True, pool_size=0)
+
     for kwargs in (
         {"ca_cert": "dummy"},
         {"client_key": "dummy"},
@@ -186,6 +320,19 @@ def test_invalid_init_options(grpc_server):
             GrpcClient(*grpc_server, insecure=True, **kwargs)
 
 
+def test_client_key_and_cert_required_together(
+    grpc_server, client_key_file, client_cert_file
+):
+    for kwargs in (
+        {"client_key": client_key_file},
+        {"client_cert": client_cert_file},
+    ):
+        with pytest.raises(
+            ValueError, match="client_key and client_cert must be provided together"
+        ):
+            GrpcClient(*grpc_server, **kwargs)
+
+
 def test_verify(model_name, grpc_server, connection_type, client_key):
     """test verify kwarg for TLS connections"""
     if connection_type != ConnectionType.TLS:
@@ -202,6 +349,22 @@ def test_verify(model_name, grpc_server, connection_type, client_key):
     assert grpc_client.generate_text(model_name, "dummy text")
 
 
+@pytest.mark.parametrize("connection_type", [ConnectionType.TLS], scope="session")
+def test_verify_server_certificate_cache(
+    mocker, model_name, grpc_server, connection_type
+):
+    from caikit_nlp_client import grpc_client
+
+    grpc_client._cached_server_certificate.cache_clear()
+    get_server_certificate_spy = mocker.spy(grpc_client, "get_server_certificate")
+
+    GrpcClient(*grpc_server, verify=False)
+    client = GrpcClient(*grpc_server, verify=False)
+
+    assert client.generate_text(model_name, "dummy text")
+    get_server_certificate_spy.assert_called_once()
+
+
 def test_grpc_client_with_bogus_certificate_files(grpc_server):
     for kwargs in (
         {"ca_cert": "/some/random/path/cert.pem"},
@@ -234,3 +397,50 @@ def test_grpc_client_load_certificate(ca_cert, ca_cert_file):
         ValueError, match=".*should be a path to a certificate files or bytes"
     ):
         GrpcClient._try_load_certificate(("Pinky", "Brain"))
+
+
+def test_grpc_client_load_certificate_cache(tmp_path):
+    cert_file = tmp_path / "cert.pem"
+    cert_file.write_bytes(b"first")
+    first = GrpcClient._try_load_certificate(str(cert_file))
+    assert first == b"first"
+    assert GrpcClient._try_load_certificate(str(cert_file)) is first
+
+    # a modified file is read again
+    cert_file.write_bytes(b"second")
+    os.utime(cert_file, ns=(0, cert_file.stat().st_mtime_ns + 1))
+    assert GrpcClient._try_load_certificate(str(cert_file)) == b"second"
+
+
+def test_grpc_client_load_certificates(ca_cert, ca_cert_file, client_key_file):
+    client_key = GrpcClient._try_load_certificate(client_key_file)
+    assert GrpcClient._load_certificates(ca_cert_file, None, client_key_file) == [
+        ca_cert,
+        None,
+        client_key,
+    ]
+    assert GrpcClient._load_certificates(None, ca_cert, None) == [None, ca_cert, None]
+
+    with pytest.raises(FileNotFoundError):
+        GrpcClient._load_certificates(ca_cert_file, "/some/random/path/cert.pem")
+
+
+def test_grpc_client_load_certificates_threads(tmp_path, mocker):
+    from caikit_nlp_client import grpc_client
+
+    executor = mocker.spy(grpc_client, "ThreadPoolExecutor")
+    paths = []
+    for name in ("ca.pem", "cert.pem", "key.pem"):
+        (tmp_path / name).write_bytes(name.encode())
+        paths.append(str(tmp_path / name))
+
+    # cold files are read in parallel
+    assert GrpcClient._load_certificates(*paths) == [b"ca.pem", b"cert.pem", b"key.pem"]
+    assert executor.call_count == 1
+
+    # cached files, or a single cold one, are read sequentially
+    assert GrpcClient._load_certificates(*paths) == [b"ca.pem", b"cert.pem", b"key.pem"]
+    (tmp_path / "key.pem").write_bytes(b"new key")
+    os.utime(paths[2], ns=(0, os.stat(paths[2]).st_mtime_ns + 1))
+    assert GrpcClient._load_certificates(*paths)[2] == b"new key"
+    assert executor.call_count == 1
@@ -1,11 +1,17 @@
+import json
 import re
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from types import GeneratorType
 
 import pytest
 import requests
-from requests.exceptions import SSLError
+from requests.exceptions import SSLError, Timeout
 
 from caikit_nlp_client import HttpClient
+from caikit_nlp_client.http_client import _iter_sse_data, _simplify_parameter_schema
 
 from .conftest import ConnectionType
 
@@ -19,6 +25,119 @@ def test_client_invalid_args():
     with pytest.raises(ValueError, match="Cannot use verify=False with ca_cert_path"):
         HttpClient("dummy_base_url", verify=False, ca_cert_path="dummy")
 
+    with pytest.raises(ValueError, match="pool_maxsize must be a positive integer"):
+        HttpClient("dummy_base_url", pool_maxsize=0)
+
+
+def test_slots():
+    client = HttpClient("dummy_base_url")
+    assert not hasattr(client, "__dict__")
+    with pytest.raises(AttributeError):
+        client._api_ur = "dummy_url"  # typo
+
+
+def test_pool_maxsize():
+    with HttpClient("http://localhost:8080", pool_maxsize=32) as client:
+        adapter = client._session.get_adapter("http://localhost:8080")
+        assert adapter._pool_maxsize == 32
+        assert client._session.get_adapter("https://localhost:8080") is adapter
+
+
+def test_retries():
+    with HttpClient("http://localhost:8080") as client:
+        retry = client._session.get_adapter("http://localhost:8080").max_retries
+        assert retry.total == 3
+        assert retry.is_retry("POST", 503)
+        assert not retry.is_retry("POST", 500)
+        assert not retry.is_retry("POST", 504)
+
+    with HttpClient("http://localhost:8080", max_retries=0) as client:
+        retry = client._session.get_adapter("http://localhost:8080").max_retries
+        assert retry.total == 0
+
+
+@contextmanager
+def serve(handler):
+    """runs an http server with `handler` in a thread, yields its url"""
+    server = ThreadingHTTPServer(("localhost", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield f"http://localhost:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_read_timeout_not_retried():
+    hits = []
+
+    class SlowHandler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            hits.append(self.path)
+            time.sleep(1)
+            self.send_response(200)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    with (
+        serve(SlowHandler) as url,
+        HttpClient(url) as client,
+        pytest.raises(Timeout),
+    ):
+        client.generate_text("dummy_model", "dummy text", timeout=0.3)
+
+    assert len(hits) == 1
+
+
+def test_gateway_error_not_retried():
+    hits = []
+
+    class GatewayTimeoutHandler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            hits.append(self.path)
+            body = b'{"details": "upstream request timeout"}'
+            self.send_response(504)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    with (
+        serve(GatewayTimeoutHandler) as url,
+        HttpClient(url) as client,
+        pytest.raises(RuntimeError, match="status_code=504"),
+    ):
+        client.generate_text("dummy_model", "dummy text")
+
+    assert len(hits) == 1
+
+
+def test_generate_text_stream_closes_response(mocker):
+    class StreamHandler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.end_headers()
+            for token in ("a", "b", "c"):
+                self.wfile.write(f'data: {{"generated_text": "{token}"}}\n\n'.encode())
+                self.wfile.flush()
+
+        def log_message(self, *args):
+            pass
+
+    close = mocker.spy(requests.Response, "close")
+    with serve(StreamHandler) as url, HttpClient(url) as client:
+        # the consumer stops early
+        stream = client.generate_text_stream("dummy_model", "dummy text")
+        assert next(stream) == "a"
+        stream.close()
+
+    close.assert_called_once()
+
 
 def test_generate_text(
     http_client, model_name, prompt, mocker, accept_self_signed_certs
@@ -28,6 +147,32 @@ def test_generate_text(
     assert generated_text
 
 
+@pytest.mark.parametrize("newline", [b"\n", b"\r\n"])
+@pytest.mark.parametrize("chunk_size", [1, 7, 1024])
+def test_iter_sse_data(newline, chunk_size):
+    stream = newline.join(
+        [
+            b"event: message",
+            b'data: {"generated_text": "a"}',
+            b"",
+            b": comment",
+            b"event: message",
+            b'data: {"generated_text":',
+            b'data: "b"}',
+            b"",
+            b"",
+            b'data: {"generated_text": "c"}',
+        ]
+    )
+    chunks = (stream[i : i + chunk_size] for i in range(0, len(stream), chunk_size))
+
+    assert list(_iter_sse_data(chunks)) == [
+        b'{"generated_text": "a"}',
+        b'{"generated_text":\n"b"}',
+        b'{"generated_text": "c"}',
+    ]
+
+
 def test_create_json_request():
     client = HttpClient("dummyurl")
     assert client._create_json_request("dummymodel", "dummytext") == {
@@ -64,7 +209,7 @@ def test_generate_text_with_optional_args(
     mocker,
     accept_self_signed_certs,
 ):
-    mock = mocker.spy(requests, "post")
+    mock = mocker.spy(http_client._session, "post")
 
     generated_text = http_client.generate_text(
         model_name, prompt, max_new_tokens=20, min_new_tokens=4
@@ -72,14 +217,15 @@ def test_generate_text_with_optional_args(
 
     assert isinstance(generated_text, str)
     assert generated_text
-    assert mock.call_args_list[-1].kwargs["json"]["parameters"]["max_new_tokens"] == 20
-    assert mock.call_args_list[-1].kwargs["json"]["parameters"]["min_new_tokens"] == 4
+    payload = json.loads(mock.call_args_list[-1].kwargs["data"])
+    assert payload["parameters"]["max_new_tokens"] == 20
+    assert payload["parameters"]["min_new_tokens"] == 4
 
 
 def test_timeout_kwarg(
     http_client, model_name, prompt, mocker, accept_self_signed_certs
 ):
-    mock = mocker.spy(requests, "post")
+    mock = mocker.spy(http_client._session, "post")
 
     http_client.generate_text(model_name, prompt)
     assert mock.call_args_list[-1].kwargs["timeout"] == 60.0
@@ -88,6 +234,13 @@ def test_timeout_kwarg(
     assert mock.call_args_list[-1].kwargs["timeout"] == 42.0
 
 
+def test_context_manager(http_client, mocker):
+    with HttpClient(http_client._api_base) as client:
+        close_spy = mocker.spy(client._session, "close")
+
+    close_spy.assert_called()
+
+
 def test_generate_text_with_no_model_id(http_client):
     with pytest.raises(ValueError, match="request must have a model id"):
         http_client.generate_text("", "dummy")
@@ -131,7 +284,7 @@ def test_generate_text_stream_with_optional_args(
             reason="stream mocking is broken, see https://github.com/opendatahub-io/caikit-nlp-client/issues/46"
         )
 
-    mock = mocker.spy(requests, "post")
+    mock = mocker.spy(http_client._session, "post")
     response = http_client.generate_text_stream(
         model_name,
         prompt,
@@ -144,8 +297,9 @@ def test_generate_text_stream_with_optional_args(
     response_list = list(response)
     assert response_list
     assert all(isinstance(text, str) for text in response_list)
-    assert mock.call_args_list[-1].kwargs["json"]["parameters"]["max_new_tokens"] == 20
-    assert mock.call_args_list[-1].kwargs["json"]["parameters"]["min_new_tokens"] == 4
+    payload = json.loads(mock.call_args_list[-1].kwargs["data"])
+    assert payload["parameters"]["max_new_tokens"] == 20
+    assert payload["parameters"]["min_new_tokens"] == 4
 
 
 def test_request_exception_handling(
@@ -229,6 +383,47 @@ def test_get_text_generation_parameters(
     assert params == expected_params
 
 
+def test_get_text_generation_parameters_cache(
+    http_client, mocker, accept_self_signed_certs
+):
+    params = http_client.get_text_generation_parameters()
+
+    spy = mocker.spy(http_client._session, "get")
+    cached_params = http_client.get_text_generation_parameters()
+    spy.assert_not_called()
+
+    # callers get their own dict
+    assert cached_params == params
+    assert cached_params is not params
+
+
+def test_simplify_parameter_schema_shared_refs():
+    def ref(name):
+        return {"allOf": [{"$ref": f"#/components/schemas/{name}"}]}
+
+    schemas = {
+        "Parameters": {
+            "properties": {
+                "max_new_tokens": {"type": "integer"},
+                "penalty": ref("Penalty"),
+                "other_penalty": ref("Penalty"),
+            }
+        },
+        "Penalty": {"properties": {"start_index": {"type": "integer"}}},
+    }
+    flattened_refs: dict = {}
+
+    result = _simplify_parameter_schema(ref("Parameters"), schemas, flattened_refs)
+    assert result == {
+        "max_new_tokens": "integer",
+        "penalty": {"start_index": "integer"},
+        "other_penalty": {"start_index": "integer"},
+    }
+    assert set(flattened_refs) == {"Parameters", "Penalty"}
+    # parameters referencing the same schema don't share their dict
+    assert result["penalty"] is not result["other_penalty"]
+
+
 def test_models_info(http_client, accept_self_signed_certs, using_real_caikit):
     models_info = http_client.models_info()
     expected_models_number = 1 if using_real_caikit else 4
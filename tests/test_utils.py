@@ -1,3 +1,4 @@
+import json
 import threading
 import time
 
@@ -5,7 +6,8 @@ import fastapi
 import pytest
 import uvicorn
 
-from caikit_nlp_client.utils import get_server_certificate
+from caikit_nlp_client import utils
+from caikit_nlp_client.utils import get_server_certificate, json_dumps, json_loads
 from tests.fixtures.utils import get_random_port
 
 
@@ -47,3 +49,21 @@ def server(app, server_key_file, server_cert_file):
 def test_get_server_certificate(server, server_cert):
     host, port = server
     assert get_server_certificate(host, port).encode() == server_cert
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json(use_orjson, monkeypatch):
+    if not use_orjson:
+        monkeypatch.setattr(utils, "orjson", None)
+    elif utils.orjson is None:
+        pytest.skip(reason="orjson is not installed")
+
+    obj = {"inputs": "h\u00e9llo", "parameters": {"max_new_tokens": 20}}
+    data = json_dumps(obj)
+    assert isinstance(data, bytes)
+    assert json.loads(data) == obj
+    assert json_loads(data) == obj
+    assert json_loads(data.decode()) == obj
+
+    with pytest.raises(json.JSONDecodeError):
+        json_loads(b'{"generated_text": ')